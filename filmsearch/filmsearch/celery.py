@@ -0,0 +1,21 @@
+"""
+Celery application for filmsearch project.
+
+Tasks are discovered in the tasks.py modules of installed apps.
+
+For more information on this file, see
+https://docs.celeryq.dev/en/stable/django/first-steps-with-django.html
+"""
+
+import os
+
+from celery import Celery
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'filmsearch.settings')
+
+app = Celery('filmsearch')
+
+# Настройки Celery читаются из settings.py с префиксом CELERY_
+app.config_from_object('django.conf:settings', namespace='CELERY')
+
+app.autodiscover_tasks()
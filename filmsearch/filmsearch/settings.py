@@ -39,6 +39,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'rest_framework',
     'corsheaders',
     'django_filters', 
@@ -114,6 +115,20 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Argon2 для новых паролей; существующие PBKDF2-хэши проверяются
+# и перехэшируются при следующем входе
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+
+# Отклонять вход с неизвестным именем без вычисления хэша пароля.
+# Экономит CPU при переборе, но позволяет определять существующие
+# имена по времени ответа
+LOGIN_FAST_FAIL_UNKNOWN_USERS = False
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/4.2/topics/i18n/
@@ -147,6 +162,35 @@ LOGIN_URL = '/movies/login/'
 LOGIN_REDIRECT_URL = '/movies/'
 LOGOUT_REDIRECT_URL = '/movies/'
 
+# Общий для всех процессов веб-сервера кэш (тот же Redis, что и брокер Celery,
+# отдельная база). Кэш процесса (LocMemCache) для сессий не подходит: выход
+# из системы сбрасывал бы сессию только в одном процессе. Статистика фильмов,
+# корень API, данные админ-панели и версия ETag каталога тоже хранятся здесь
+# в одном экземпляре, и сброс кэша сигналами виден всем процессам
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': 'redis://localhost:6379/1',
+        'KEY_PREFIX': 'filmsearch',
+    }
+}
+
+# Сессии читаются из кэша, запись дублируется в БД
+SESSION_ENGINE = 'django.contrib.sessions.backends.cached_db'
+
+# Очередь фоновых задач (генерация PDF отчетов)
+CELERY_BROKER_URL = 'redis://localhost:6379/0'
+CELERY_TASK_IGNORE_RESULT = True
+CELERY_BEAT_SCHEDULE = {
+    'cleanup-expired-reports': {
+        'task': 'movies.tasks.cleanup_expired_reports',
+        'schedule': 60 * 60,
+    },
+}
+
+# Время хранения готовых PDF отчетов, в секундах
+PDF_REPORT_TTL = 24 * 60 * 60
+
 # CORS настройки для React
 CORS_ALLOWED_ORIGINS = [
     "http://localhost:3000",
@@ -1,21 +1,169 @@
 from django.contrib import admin, messages
-from django.db.models import Count, Avg, QuerySet
-from django.utils.html import format_html, mark_safe
+from django.contrib.admin.views.main import ChangeList
+from django.db.models import (
+    Count, Q, QuerySet, Case, When, Value, CharField, BooleanField, ExpressionWrapper
+)
+from django.db.models.functions import Substr
+from django.contrib.postgres.aggregates import ArrayAgg, StringAgg
+from django.core.paginator import Paginator
+from django.db import connection
+from django.utils.functional import cached_property
+from django.utils.html import format_html, mark_safe, escape
 from django.urls import reverse
-from django.http import HttpResponseRedirect, HttpResponse, HttpRequest
-from django.template.loader import render_to_string
+from django.http import HttpResponseRedirect, FileResponse, HttpRequest, Http404
+from django.shortcuts import render
 from django.contrib.admin.views.decorators import staff_member_required
 from django.conf import settings
 from typing import Any, Dict, List, Optional, Union
 from django.contrib.auth.models import User
 from django.forms import BaseModelForm
-import weasyprint
 from .models import (
     Genre, ActorDirector, MovieTVShow, MovieTVShowActorDirector,
     Collection, CollectionItem, UserProfile, UserGenrePreference, Recommendation,
     Rating, Review, ReviewVote, UserWatchlist
 )
 from django.utils import timezone
+from bisect import bisect_right
+from .signals import invalidate_catalog_caches
+from .tasks import (
+    submit_pdf_report, render_movie_report, render_movies_summary_report,
+    get_report_status, get_report_path, is_valid_task_id,
+    REPORT_READY, REPORT_CHUNK_SIZE
+)
+from kombu.exceptions import OperationalError
+
+# Сообщение администратору, если задачу не удалось поставить в очередь
+PDF_QUEUE_UNAVAILABLE_MESSAGE = 'Очередь генерации отчетов недоступна, попробуйте позже'
+
+
+# Цвета рейтинга: красный, оранжевый, синий, зеленый (по возрастанию порогов)
+_RATING_COLORS = ('c62828', 'ffa000', '1976d2', '2e7d32')
+_REVIEW_RATING_THRESHOLDS = (40, 60, 80)
+_MOVIE_RATING_THRESHOLDS = (4, 6, 8)
+
+# Тип подборки, вычисляемый в SQL для связанных элементов подборок
+_COLLECTION_TYPE_LABEL = Case(
+    When(collection__is_system=True, then=Value('Системная')),
+    default=Value('Пользовательская'),
+    output_field=CharField()
+)
+
+# Заранее подготовленные HTML-шаблоны для колонок списков, которые
+# рендерятся для каждой строки (аргументы экранируются через escape)
+_PHOTO_FILE_THUMB_TPL = '<img src="%s" width="40" height="40" style="object-fit: cover; border-radius: 4px;" title="Файл: %s" />'
+_PHOTO_URL_THUMB_TPL = '<img src="%s" width="40" height="40" style="object-fit: cover; border-radius: 4px;" title="URL" />'
+_POSTER_FILE_THUMB_TPL = '<img src="%s" width="40" height="60" style="object-fit: cover; border-radius: 4px;" title="Файл: %s" />'
+_POSTER_URL_THUMB_TPL = '<img src="%s" width="40" height="60" style="object-fit: cover; border-radius: 4px;" title="URL" />'
+_INLINE_PHOTO_TPL = '<img src="%s" width="50" height="50" style="object-fit: cover;" />'
+_INLINE_POSTER_TPL = '<img src="%s" width="50" height="70" style="object-fit: cover;" />'
+_RATING_PERCENT_TPL = '<span style="color: #%s;">%s%%</span>'
+_RATING_SCORE_TPL = '<span style="color: #%s;">%s/10</span>'
+
+
+class FasterAdminPaginator(Paginator):
+    """
+    Пагинатор с оценочным количеством записей для больших таблиц.
+    
+    Для нефильтрованного списка вместо SELECT COUNT(*) берет оценку
+    количества строк из статистики PostgreSQL (pg_class.reltuples).
+    При наличии фильтров используется точный подсчет.
+    """
+    
+    @cached_property
+    def count(self) -> int:
+        """
+        Количество записей (оценочное для нефильтрованного списка).
+        
+        Returns:
+            int: Количество записей
+        """
+        query = getattr(self.object_list, 'query', None)
+        if query is not None and not query.where:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    'SELECT reltuples::bigint FROM pg_class WHERE relname = %s',
+                    [self.object_list.model._meta.db_table]
+                )
+                row = cursor.fetchone()
+            # reltuples = -1, если таблица еще ни разу не анализировалась
+            if row and row[0] > 0:
+                return row[0]
+        return super().count
+
+
+class PkSlicingAdminPaginator(FasterAdminPaginator):
+    """
+    Пагинатор, выполняющий OFFSET/LIMIT только по первичным ключам.
+    
+    Для широких строк с аннотациями смещение по полной выборке тянет
+    все колонки пропускаемых строк. Здесь сначала выбираются ключи
+    нужной страницы, а полные строки загружаются уже по ним.
+    """
+    
+    def page(self, number: Any):
+        """
+        Получение страницы с выборкой строк по первичным ключам.
+        
+        Args:
+            number: Номер страницы
+            
+        Returns:
+            Page: Объект страницы
+        """
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        top = bottom + self.per_page
+        if top + self.orphans >= self.count:
+            top = self.count
+        object_list = self.object_list
+        if isinstance(object_list, QuerySet):
+            object_list = object_list.filter(
+                pk__in=object_list.values('pk')[bottom:top]
+            )
+        else:
+            object_list = object_list[bottom:top]
+        return self._get_page(object_list, number, self)
+
+
+class DeferredFieldsChangeList(ChangeList):
+    """
+    ChangeList, не загружающий тяжелые текстовые колонки.
+    
+    Поля перечисляются в атрибуте list_deferred_fields админ-класса
+    и откладываются только в списке, форма редактирования их получает.
+    """
+    
+    def get_queryset(self, request: HttpRequest, *args: Any, **kwargs: Any) -> QuerySet:
+        """
+        Queryset списка с отложенной загрузкой текстовых полей.
+        
+        Args:
+            request: HTTP запрос
+            
+        Returns:
+            QuerySet: Queryset без тяжелых колонок
+        """
+        qs = super().get_queryset(request, *args, **kwargs)
+        return qs.defer(*self.model_admin.list_deferred_fields)
+
+
+class MovieChangelistLinkMixin:
+    """
+    Примесь для админ-классов со ссылками на список фильмов/сериалов.
+    
+    URL списка вычисляется через reverse() один раз на экземпляр админки,
+    а не для каждой строки списка.
+    """
+    
+    @cached_property
+    def _movies_changelist_url(self) -> str:
+        """
+        URL списка фильмов/сериалов в админке.
+        
+        Returns:
+            str: URL списка фильмов/сериалов
+        """
+        return reverse('admin:movies_movietvshow_changelist')
 
 
 class MovieTVShowInline(admin.TabularInline):
@@ -32,6 +180,18 @@ class MovieTVShowInline(admin.TabularInline):
     raw_id_fields = ('movietvshow',)
     readonly_fields = ('get_title', 'get_type', 'get_release_date')
     
+    def get_queryset(self, request: HttpRequest) -> QuerySet:
+        """
+        Queryset связей с предзагрузкой фильмов/сериалов.
+        
+        Args:
+            request: HTTP запрос
+            
+        Returns:
+            QuerySet: Queryset связей жанр-фильм
+        """
+        return super().get_queryset(request).select_related('movietvshow')
+    
     def get_title(self, obj: Any) -> str:
         """
         Получение названия фильма/сериала.
@@ -86,7 +246,7 @@ class MovieTVShowInline(admin.TabularInline):
 
 
 @admin.register(Genre)
-class GenreAdmin(admin.ModelAdmin):
+class GenreAdmin(MovieChangelistLinkMixin, admin.ModelAdmin):
     """
     Админ-панель для модели Genre.
     
@@ -123,7 +283,7 @@ class GenreAdmin(admin.ModelAdmin):
         Returns:
             int: Количество фильмов/сериалов
         """
-        return obj.movies.count()
+        return obj.movies_count_val
     
     @admin.display(description='Фильмы/Сериалы')
     def show_movies_link(self, obj: Genre) -> str:
@@ -136,7 +296,7 @@ class GenreAdmin(admin.ModelAdmin):
         Returns:
             str: HTML ссылка на фильтрованный список
         """
-        url = reverse('admin:movies_movietvshow_changelist') + f'?genres__id__exact={obj.id}'
+        url = f'{self._movies_changelist_url}?genres__id__exact={obj.id}'
         return format_html('<a href="{}">Показать фильмы</a>', url)
 
 
@@ -155,6 +315,18 @@ class MovieTVShowActorDirectorInline(admin.TabularInline):
     readonly_fields = ('get_movie_title', 'get_movie_type', 'get_release_date')
     fields = ('movie_tvshow', 'get_movie_title', 'get_movie_type', 'get_release_date', 'role', 'character_name')
     
+    def get_queryset(self, request: HttpRequest) -> QuerySet:
+        """
+        Queryset ролей с предзагрузкой фильмов/сериалов.
+        
+        Args:
+            request: HTTP запрос
+            
+        Returns:
+            QuerySet: Queryset ролей
+        """
+        return super().get_queryset(request).select_related('movie_tvshow')
+    
     def get_movie_title(self, obj: MovieTVShowActorDirector) -> str:
         """
         Получение названия фильма/сериала.
@@ -196,7 +368,7 @@ class MovieTVShowActorDirectorInline(admin.TabularInline):
 
 
 @admin.register(ActorDirector)
-class ActorDirectorAdmin(admin.ModelAdmin):
+class ActorDirectorAdmin(MovieChangelistLinkMixin, admin.ModelAdmin):
     """
     Админ-панель для модели ActorDirector.
     
@@ -228,6 +400,19 @@ class ActorDirectorAdmin(admin.ModelAdmin):
     )
     inlines = [MovieTVShowActorDirectorInline]
     list_per_page = 20
+    list_deferred_fields = ('biography',)
+    
+    def get_changelist(self, request: HttpRequest, **kwargs: Any) -> type:
+        """
+        Список без загрузки биографии.
+        
+        Args:
+            request: HTTP запрос
+            
+        Returns:
+            type: Класс ChangeList
+        """
+        return DeferredFieldsChangeList
     
     def get_queryset(self, request: HttpRequest) -> QuerySet:
         """
@@ -237,10 +422,20 @@ class ActorDirectorAdmin(admin.ModelAdmin):
             request: HTTP запрос
             
         Returns:
-            QuerySet: Queryset с аннотацией movies_count_val
+            QuerySet: Queryset с аннотациями movies_count_val, has_photo_file_val, has_resume_file_val
         """
         qs = super().get_queryset(request)
-        qs = qs.annotate(movies_count_val=Count('movies'))
+        qs = qs.annotate(
+            movies_count_val=Count('movies'),
+            has_photo_file_val=ExpressionWrapper(
+                Q(photo_image__isnull=False) & ~Q(photo_image=''),
+                output_field=BooleanField()
+            ),
+            has_resume_file_val=ExpressionWrapper(
+                Q(resume_file__isnull=False) & ~Q(resume_file=''),
+                output_field=BooleanField()
+            )
+        )
         return qs
     
     @admin.display(description='Фото')
@@ -272,11 +467,11 @@ class ActorDirectorAdmin(admin.ModelAdmin):
             str: HTML изображение или '-'
         """
         if obj.photo_image:
-            return format_html('<img src="{}" width="40" height="40" style="object-fit: cover; border-radius: 4px;" title="Файл: {}" />', 
-                            obj.photo_image.url, obj.photo_image.name.split('/')[-1])
+            return mark_safe(_PHOTO_FILE_THUMB_TPL % (
+                escape(obj.photo_image.url), escape(obj.photo_image.name.split('/')[-1])
+            ))
         elif obj.photo_url:
-            return format_html('<img src="{}" width="40" height="40" style="object-fit: cover; border-radius: 4px;" title="URL" />', 
-                            obj.photo_url)
+            return mark_safe(_PHOTO_URL_THUMB_TPL % escape(obj.photo_url))
         return '-'
     
     @admin.display(description='Резюме')  
@@ -291,7 +486,7 @@ class ActorDirectorAdmin(admin.ModelAdmin):
             str: HTML ссылка на файл или '-'
         """
         if obj.resume_file:
-            file_size_mb = obj.resume_file.size / (1024 * 1024) 
+            file_size_mb = (obj.get_resume_file_size() or 0) / (1024 * 1024) 
             file_name = obj.resume_file.name.split('/')[-1]
             display_name = file_name[:20] + '...' if len(file_name) > 20 else file_name
             
@@ -331,7 +526,7 @@ class ActorDirectorAdmin(admin.ModelAdmin):
         Returns:
             int: Количество фильмов/сериалов
         """
-        return obj.movies.count()
+        return obj.movies_count_val
     
     @admin.display(description='Фильмы/Сериалы')
     def show_movies_link(self, obj: ActorDirector) -> str:
@@ -344,10 +539,10 @@ class ActorDirectorAdmin(admin.ModelAdmin):
         Returns:
             str: HTML ссылка на фильтрованный список
         """
-        url = reverse('admin:movies_movietvshow_changelist') + f'?actors_directors__id__exact={obj.id}'
+        url = f'{self._movies_changelist_url}?actors_directors__id__exact={obj.id}'
         return format_html('<a href="{}">Показать фильмы</a>', url)
     
-    @admin.display(description='Фото файл', boolean=True)
+    @admin.display(description='Фото файл', boolean=True, ordering='has_photo_file_val')
     def has_photo_file(self, obj: ActorDirector) -> bool:
         """
         Проверка наличия файла фото.
@@ -358,9 +553,9 @@ class ActorDirectorAdmin(admin.ModelAdmin):
         Returns:
             bool: True если есть файл фото
         """
-        return bool(obj.photo_image)
+        return obj.has_photo_file_val
     
-    @admin.display(description='Резюме файл', boolean=True)
+    @admin.display(description='Резюме файл', boolean=True, ordering='has_resume_file_val')
     def has_resume_file(self, obj: ActorDirector) -> bool:
         """
         Проверка наличия файла резюме.
@@ -371,7 +566,7 @@ class ActorDirectorAdmin(admin.ModelAdmin):
         Returns:
             bool: True если есть файл резюме
         """
-        return bool(obj.resume_file)
+        return obj.has_resume_file_val
     
     @admin.display(description='Предпросмотр фото файла')
     def photo_file_preview(self, obj: ActorDirector) -> str:
@@ -400,7 +595,7 @@ class ActorDirectorAdmin(admin.ModelAdmin):
             str: HTML с информацией о файле
         """
         if obj.resume_file:
-            file_size = obj.resume_file.size
+            file_size = obj.get_resume_file_size() or 0
             file_size_mb = file_size / (1024 * 1024)
             return format_html(
                 '<p><strong>Файл:</strong> {}<br><strong>Размер:</strong> {} МБ<br><a href="{}" target="_blank">📄 Скачать</a></p>',
@@ -429,14 +624,15 @@ class MovieTVShowActorDirectorInlineForMovie(admin.TabularInline):
     fields = ('actor_director', 'role', 'character_name', 'get_photo')
     readonly_fields = ('get_photo',)
     
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('actor_director')
+    
     def get_photo(self, obj):
         if obj.actor_director:
             if obj.actor_director.photo_image:
-                return format_html('<img src="{}" width="50" height="50" style="object-fit: cover;" />', 
-                                obj.actor_director.photo_image.url)
+                return mark_safe(_INLINE_PHOTO_TPL % escape(obj.actor_director.photo_image.url))
             elif obj.actor_director.photo_url:
-                return format_html('<img src="{}" width="50" height="50" style="object-fit: cover;" />', 
-                                obj.actor_director.photo_url)
+                return mark_safe(_INLINE_PHOTO_TPL % escape(obj.actor_director.photo_url))
         return '-'
     get_photo.short_description = 'Фото'
 
@@ -484,10 +680,13 @@ class CollectionItemInlineForMovie(admin.TabularInline):
     readonly_fields = ('added_at', 'get_collection_type')
     fields = ('collection', 'get_collection_type', 'added_at')
     
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('collection').annotate(
+            collection_type_label=_COLLECTION_TYPE_LABEL
+        )
+    
     def get_collection_type(self, obj):
-        if obj.collection and obj.collection.is_system:
-            return 'Системная'
-        return 'Пользовательская'
+        return obj.collection_type_label
     get_collection_type.short_description = 'Тип подборки'
 
 
@@ -501,6 +700,11 @@ class CollectionItemInline(admin.TabularInline):
     readonly_fields = ('added_at', 'get_movie_type', 'get_rating', 'get_poster')
     fields = ('movie_tvshow', 'get_movie_type', 'get_rating', 'get_poster', 'added_at')
     
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related(
+            'movie_tvshow'
+        ).prefetch_related('movie_tvshow__ratings')
+    
     def get_movie_type(self, obj):
         return obj.movie_tvshow.get_type_display() if obj.movie_tvshow else '-'
     get_movie_type.short_description = 'Тип'
@@ -516,17 +720,15 @@ class CollectionItemInline(admin.TabularInline):
     def get_poster(self, obj):
         if obj.movie_tvshow:
             if obj.movie_tvshow.poster_image:
-                return format_html('<img src="{}" width="50" height="70" style="object-fit: cover;" />', 
-                                obj.movie_tvshow.poster_image.url)
+                return mark_safe(_INLINE_POSTER_TPL % escape(obj.movie_tvshow.poster_image.url))
             elif obj.movie_tvshow.poster_url:
-                return format_html('<img src="{}" width="50" height="70" style="object-fit: cover;" />', 
-                                obj.movie_tvshow.poster_url)
+                return mark_safe(_INLINE_POSTER_TPL % escape(obj.movie_tvshow.poster_url))
         return '-'
     get_poster.short_description = 'Постер'
 
 
 @admin.register(Collection)
-class CollectionAdmin(admin.ModelAdmin):
+class CollectionAdmin(MovieChangelistLinkMixin, admin.ModelAdmin):
     """Админ-панель для модели Collection"""
     list_display = ('title', 'get_user_display', 'is_system', 'is_public', 'created_at', 'items_count', 'show_items_link')
     list_filter = ('is_system', 'is_public', 'created_at')
@@ -535,6 +737,7 @@ class CollectionAdmin(admin.ModelAdmin):
     inlines = [CollectionItemInline]
     readonly_fields = ('created_at', 'updated_at')
     list_per_page = 20
+    paginator = PkSlicingAdminPaginator
     
     def get_fieldsets(self, request, obj=None):
         """Динамически определяем набор полей в зависимости от типа подборки"""
@@ -602,11 +805,11 @@ class CollectionAdmin(admin.ModelAdmin):
     
     @admin.display(description='Количество элементов', ordering='items_count_val')
     def items_count(self, obj):
-        return obj.get_items_count()
+        return obj.items_count_val
     
     @admin.display(description='Фильмы/Сериалы')
     def show_items_link(self, obj):
-        url = reverse('admin:movies_movietvshow_changelist') + f'?collections__id__exact={obj.id}'
+        url = f'{self._movies_changelist_url}?collections__id__exact={obj.id}'
         return format_html('<a href="{}">Показать фильмы</a>', url)
     
     def save_model(self, request, obj, form, change):
@@ -624,18 +827,24 @@ class CollectionItemAdmin(admin.ModelAdmin):
     list_filter = ('added_at', 'collection__is_system', 'movie_tvshow__type')
     search_fields = ('movie_tvshow__title', 'collection__title')
     raw_id_fields = ('movie_tvshow', 'collection')
+    list_select_related = ('movie_tvshow', 'collection')
     date_hierarchy = 'added_at'
     readonly_fields = ('added_at',)
     list_per_page = 30
+    paginator = FasterAdminPaginator
+    show_full_result_count = False
+    
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(
+            collection_type_label=_COLLECTION_TYPE_LABEL
+        )
     
     def get_movie_type(self, obj):
         return obj.movie_tvshow.get_type_display() if obj.movie_tvshow else '-'
     get_movie_type.short_description = 'Тип'
     
     def get_collection_type(self, obj):
-        if obj.collection and obj.collection.is_system:
-            return 'Системная'
-        return 'Пользовательская'
+        return obj.collection_type_label
     get_collection_type.short_description = 'Тип подборки'
 
 
@@ -658,9 +867,21 @@ class UserProfileAdmin(admin.ModelAdmin):
     exclude = ('preferred_genres',)
     inlines = [PreferredGenresInline]
     
+    def get_queryset(self, request):
+        """Названия предпочитаемых жанров агрегируются в основном запросе"""
+        return super().get_queryset(request).select_related('user').annotate(
+            preferred_genre_names=ArrayAgg(
+                'preferred_genres__name',
+                distinct=True,
+                ordering='preferred_genres__name',
+                filter=Q(preferred_genres__isnull=False),
+                default=Value([])
+            )
+        )
+    
     @admin.display(description='Предпочитаемые жанры')
     def get_preferred_genres(self, obj):
-        genres = [genre.name for genre in obj.preferred_genres.all()[:5]]
+        genres = obj.preferred_genre_names[:5]
         if len(genres) > 0:
             return ', '.join(genres)
         return 'Не указаны'
@@ -682,17 +903,32 @@ class RecommendationAdmin(admin.ModelAdmin):
     list_filter = ('created_at', 'reason_code', 'movie_tvshow__type', 'movie_tvshow__genres')
     search_fields = ('user__username', 'movie_tvshow__title')
     raw_id_fields = ('user', 'movie_tvshow')
+    list_select_related = ('user', 'movie_tvshow')
     date_hierarchy = 'created_at'
     readonly_fields = ('created_at',)
     list_per_page = 20
     
+    def get_queryset(self, request):
+        """Названия жанров фильма агрегируются в основном запросе"""
+        return super().get_queryset(request).select_related(
+            'user', 'movie_tvshow'
+        ).annotate(
+            genre_names=ArrayAgg(
+                'movie_tvshow__genres__name',
+                distinct=True,
+                ordering='movie_tvshow__genres__name',
+                filter=Q(movie_tvshow__genres__isnull=False),
+                default=Value([])
+            )
+        )
+    
     def get_movie_type(self, obj):
         return obj.movie_tvshow.get_type_display() if obj.movie_tvshow else '-'
     get_movie_type.short_description = 'Тип'
     
     def get_genres(self, obj):
         if obj.movie_tvshow:
-            genres = [genre.name for genre in obj.movie_tvshow.genres.all()[:3]]
+            genres = obj.genre_names[:3]
             if len(genres) > 0:
                 return ', '.join(genres)
         return '-'
@@ -706,9 +942,12 @@ class RatingAdmin(admin.ModelAdmin):
     list_filter = ('rating_value', 'created_at', 'movie_tvshow__type')
     search_fields = ('user__username', 'movie_tvshow__title')
     raw_id_fields = ('user', 'movie_tvshow')
+    list_select_related = ('user', 'movie_tvshow')
     date_hierarchy = 'created_at'
     readonly_fields = ('created_at',)
     list_per_page = 20
+    paginator = FasterAdminPaginator
+    show_full_result_count = False
     
     def get_movie_type(self, obj):
         return obj.movie_tvshow.get_type_display() if obj.movie_tvshow else '-'
@@ -733,11 +972,15 @@ class ReviewAdmin(admin.ModelAdmin):
     list_filter = ('moderation_status', 'created_at', 'movie_tvshow__type', 'moderated_by')
     search_fields = ('user__username', 'movie_tvshow__title', 'review_text')
     raw_id_fields = ('user', 'movie_tvshow', 'moderated_by')
+    list_select_related = ('user', 'movie_tvshow', 'moderated_by')
     date_hierarchy = 'created_at'
     readonly_fields = ('created_at', 'likes_count', 'dislikes_count', 'moderated_at')
     inlines = [ReviewVoteInline]
     list_per_page = 20
+    paginator = PkSlicingAdminPaginator
+    show_full_result_count = False
     actions = ['approve_reviews', 'reject_reviews']
+    list_deferred_fields = ('review_text', 'rejection_reason')
     
     fieldsets = (
         ('Основная информация', {
@@ -755,49 +998,61 @@ class ReviewAdmin(admin.ModelAdmin):
         }),
     )
     
+    def get_queryset(self, request):
+        """Аннотация количества лайков/дизлайков одним агрегирующим запросом"""
+        return super().get_queryset(request).select_related(
+            'user', 'movie_tvshow', 'moderated_by'
+        ).annotate(
+            likes_val=Count('votes', filter=Q(votes__vote_type='like')),
+            dislikes_val=Count('votes', filter=Q(votes__vote_type='dislike')),
+            review_text_head=Substr('review_text', 1, 51)
+        )
+    
+    def get_changelist(self, request, **kwargs):
+        """Список без загрузки полного текста отзыва"""
+        return DeferredFieldsChangeList
+    
     def get_movie_type(self, obj):
         return obj.movie_tvshow.get_type_display() if obj.movie_tvshow else '-'
     get_movie_type.short_description = 'Тип'
     
     @admin.display(description='Текст отзыва')
     def short_text(self, obj):
-        if len(obj.review_text) > 50:
-            return obj.review_text[:50] + '...'
-        return obj.review_text
+        text = obj.review_text_head
+        if len(text) > 50:
+            return text[:50] + '...'
+        return text
     
-    @admin.display(description='Лайки')
+    @admin.display(description='Лайки', ordering='likes_val')
     def likes_count(self, obj):
-        return obj.get_likes_count()
+        return obj.likes_val
     
-    @admin.display(description='Дизлайки')
+    @admin.display(description='Дизлайки', ordering='dislikes_val')
     def dislikes_count(self, obj):
-        return obj.get_dislikes_count()
+        return obj.dislikes_val
     
     @admin.display(description='Рейтинг (%)')
     def rating_percent(self, obj):
-        rating = obj.get_rating()
-        return format_html('<span style="color: #{};">{}%</span>', 
-                        self.get_rating_color(rating), f'{rating:.1f}')
+        total = obj.likes_val + obj.dislikes_val
+        rating = (obj.likes_val / total) * 100 if total else 0
+        return mark_safe(_RATING_PERCENT_TPL % (self.get_rating_color(rating), f'{rating:.1f}'))
     
     def get_rating_color(self, rating):
         """Возвращает цвет в зависимости от рейтинга"""
-        if rating >= 80:
-            return '2e7d32'  # зеленый
-        elif rating >= 60:
-            return '1976d2'  # синий
-        elif rating >= 40:
-            return 'ffa000'  # оранжевый
-        else:
-            return 'c62828'  # красный
+        return _RATING_COLORS[bisect_right(_REVIEW_RATING_THRESHOLDS, rating)]
     
     @admin.action(description='Одобрить выбранные отзывы')
     def approve_reviews(self, request, queryset):
-        """Массовое одобрение отзывов"""
-        updated = 0
-        for review in queryset:
-            if review.moderation_status != 'approved':
-                review.approve(request.user)
-                updated += 1
+        """Массовое одобрение отзывов одним UPDATE-запросом"""
+        updated = queryset.exclude(moderation_status='approved').update(
+            moderation_status='approved',
+            moderated_by=request.user,
+            moderated_at=timezone.now(),
+            rejection_reason=''
+        )
+        # UPDATE не отправляет post_save, поэтому кэши сбрасываются явно
+        if updated:
+            invalidate_catalog_caches()
         
         self.message_user(
             request,
@@ -807,12 +1062,15 @@ class ReviewAdmin(admin.ModelAdmin):
     
     @admin.action(description='Отклонить выбранные отзывы')
     def reject_reviews(self, request, queryset):
-        """Массовое отклонение отзывов"""
-        updated = 0
-        for review in queryset:
-            if review.moderation_status != 'rejected':
-                review.reject(request.user, 'Массовое отклонение администратором')
-                updated += 1
+        """Массовое отклонение отзывов одним UPDATE-запросом"""
+        updated = queryset.exclude(moderation_status='rejected').update(
+            moderation_status='rejected',
+            moderated_by=request.user,
+            moderated_at=timezone.now(),
+            rejection_reason='Массовое отклонение администратором'
+        )
+        if updated:
+            invalidate_catalog_caches()
         
         self.message_user(
             request,
@@ -828,6 +1086,7 @@ class ReviewVoteAdmin(admin.ModelAdmin):
     list_filter = ('vote_type', 'voted_at')
     search_fields = ('user__username', 'review__review_text', 'review__movie_tvshow__title')
     raw_id_fields = ('user', 'review')
+    list_select_related = ('user', 'review__movie_tvshow')
     date_hierarchy = 'voted_at'
     readonly_fields = ('voted_at',)
     list_per_page = 20
@@ -846,9 +1105,12 @@ class UserWatchlistAdmin(admin.ModelAdmin):
     list_filter = ('status', 'added_at', 'movie_tvshow__type')
     search_fields = ('user__username', 'movie_tvshow__title')
     raw_id_fields = ('user', 'movie_tvshow')
+    list_select_related = ('user', 'movie_tvshow')
     date_hierarchy = 'added_at'
     readonly_fields = ('added_at',)
     list_per_page = 20
+    paginator = FasterAdminPaginator
+    show_full_result_count = False
     
     def get_movie_type(self, obj):
         return obj.movie_tvshow.get_type_display() if obj.movie_tvshow else '-'
@@ -869,7 +1131,10 @@ class MovieTVShowAdmin(admin.ModelAdmin):
     filter_horizontal = ('genres',)
     list_display_links = ('title',)
     list_per_page = 20
+    paginator = PkSlicingAdminPaginator
+    show_full_result_count = False
     actions = ['generate_movies_summary_pdf', 'mark_as_finished', 'mark_as_ongoing']
+    list_deferred_fields = ('description',)
     
     fieldsets = (
         ('Основная информация', {
@@ -911,43 +1176,28 @@ class MovieTVShowAdmin(admin.ModelAdmin):
             RatingInline, ReviewInline, UserWatchlistInline, CollectionItemInlineForMovie]
     
     def get_queryset(self, request):
-        return super().get_queryset(request).prefetch_related(
-            'genres', 'ratings', 'reviews', 'actors_directors'
-        ).annotate(
-            ratings_count_val=Count('ratings', distinct=True),
-            reviews_count_val=Count('reviews', distinct=True)
+        return super().get_queryset(request).annotate(
+            genres_str=StringAgg('genres__name', ', ', distinct=True, ordering='genres__name')
         )
     
-    @admin.display(description='Жанры')
+    def get_changelist(self, request, **kwargs):
+        """Список без загрузки описания"""
+        return DeferredFieldsChangeList
+    
+    @admin.display(description='Жанры', ordering='genres_str')
     def get_genres_display(self, obj):
-        return ', '.join([genre.name for genre in obj.genres.all()[:3]])
+        return obj.genres_str or '-'
     
-    @admin.display(description='Средняя оценка')
+    @admin.display(description='Средняя оценка', ordering='avg_rating')
     def average_rating_display(self, obj):
-        avg = obj.average_rating
+        avg = obj.avg_rating
         if avg > 0:
-            return format_html('<span style="color: #{};">{}/10</span>', 
-                            self.get_rating_color(avg), f'{avg:.1f}')
+            return mark_safe(_RATING_SCORE_TPL % (self.get_rating_color(avg), f'{avg:.1f}'))
         return 'Нет оценок'
     
     def get_rating_color(self, rating):
         """Возвращает цвет в зависимости от рейтинга"""
-        if rating >= 8:
-            return '2e7d32'  # зеленый
-        elif rating >= 6:
-            return '1976d2'  # синий
-        elif rating >= 4:
-            return 'ffa000'  # оранжевый
-        else:
-            return 'c62828'  # красный
-    
-    @admin.display(description='Количество оценок', ordering='ratings_count_val')
-    def ratings_count(self, obj):
-        return obj.ratings.count()
-    
-    @admin.display(description='Количество отзывов', ordering='reviews_count_val')
-    def reviews_count(self, obj):
-        return obj.reviews.count()
+        return _RATING_COLORS[bisect_right(_MOVIE_RATING_THRESHOLDS, rating)]
     
     @admin.display(description='Постер')
     def poster_preview(self, obj):
@@ -962,11 +1212,11 @@ class MovieTVShowAdmin(admin.ModelAdmin):
     def poster_display(self, obj):
         """Отображение постера в списке (приоритет файлу, затем URL)"""
         if obj.poster_image:
-            return format_html('<img src="{}" width="40" height="60" style="object-fit: cover; border-radius: 4px;" title="Файл: {}" />', 
-                             obj.poster_image.url, obj.poster_image.name.split('/')[-1])
+            return mark_safe(_POSTER_FILE_THUMB_TPL % (
+                escape(obj.poster_image.url), escape(obj.poster_image.name.split('/')[-1])
+            ))
         elif obj.poster_url:
-            return format_html('<img src="{}" width="40" height="60" style="object-fit: cover; border-radius: 4px;" title="URL" />', 
-                             obj.poster_url)
+            return mark_safe(_POSTER_URL_THUMB_TPL % escape(obj.poster_url))
         return '-'
     
     @admin.display(description='Полный постер')
@@ -984,40 +1234,49 @@ class MovieTVShowAdmin(admin.ModelAdmin):
             return format_html('<img src="{}" width="100" height="140" style="object-fit: cover;" />', obj.poster_image.url)
         return '-'
     
+    @cached_property
+    def _movie_pdf_link_tpl(self) -> str:
+        """Шаблон ссылки на PDF отчет: reverse() вызывается один раз, а не для каждой строки"""
+        url_tpl = reverse('admin_movie_pdf', args=[0]).replace('/0/', '/%d/')
+        return f'<a href="{url_tpl}" target="_blank">📄 PDF отчет</a>'
+    
     @admin.display(description='PDF отчет')
     def movie_pdf_report(self, obj):
         """Генерирует ссылку на PDF отчет о фильме"""
-        url = reverse('admin_movie_pdf', args=[obj.id])
-        return mark_safe(f'<a href="{url}" target="_blank">📄 PDF отчет</a>')
+        return mark_safe(self._movie_pdf_link_tpl % obj.id)
     
     @admin.action(description='Сгенерировать сводный PDF отчет по выбранным фильмам')
     def generate_movies_summary_pdf(self, request, queryset):
         """Генерирует сводный PDF отчет по выбранным фильмам"""
-        movies = queryset.select_related().prefetch_related('genres', 'reviews', 'ratings')
-        
-        context = {
-            'movies': movies,
-            'total_movies': movies.count(),
-            'report_date': timezone.now(),
-        }
+        # в очередь передаются только идентификаторы в порядке списка,
+        # данные для отчета выбирает воркер
+        movie_ids = list(queryset.values_list('pk', flat=True))
         
-        # рендерим HTML шаблон
-        html = render_to_string('admin/movies/movies_summary_pdf.html', context)
-        
-        # создаем HTTP ответ с PDF
-        response = HttpResponse(content_type='application/pdf')
-        response['Content-Disposition'] = f'filename=movies_summary_report_{timezone.now().strftime("%Y%m%d_%H%M")}.pdf'
-        
-        # генерация PDF с помощью WeasyPrint
-        weasyprint.HTML(string=html).write_pdf(response)
+        # верстка PDF выполняется в фоне, администратор получает ссылку на отчет
+        try:
+            task_id = submit_pdf_report(
+                render_movies_summary_report,
+                f'movies_summary_report_{timezone.now().strftime("%Y%m%d_%H%M")}',
+                movie_ids
+            )
+        except OperationalError:
+            self.message_user(request, PDF_QUEUE_UNAVAILABLE_MESSAGE, messages.ERROR)
+            return
+        status_url = reverse('admin_pdf_report_status', args=[task_id])
         
-        return response
+        self.message_user(
+            request,
+            format_html('Сводный PDF отчет формируется: <a href="{}" target="_blank">открыть отчет</a>', status_url),
+            messages.INFO
+        )
     
     @admin.action(description='Отметить выбранные сериалы как завершенные')
     def mark_as_finished(self, request, queryset):
         """Массово отмечает сериалы как завершенные"""
         tv_shows = queryset.filter(type='tv_show')
         updated = tv_shows.update(status='finished')
+        if updated:
+            invalidate_catalog_caches()
         
         self.message_user(
             request,
@@ -1030,6 +1289,8 @@ class MovieTVShowAdmin(admin.ModelAdmin):
         """Массово отмечает сериалы как выходящие"""
         tv_shows = queryset.filter(type='tv_show')
         updated = tv_shows.update(status='ongoing')
+        if updated:
+            invalidate_catalog_caches()
         
         self.message_user(
             request,
@@ -1043,33 +1304,46 @@ def admin_movie_pdf(request, movie_id):
     """Генерация PDF отчета о фильме для администраторов"""
     from django.shortcuts import get_object_or_404
     
-    movie = get_object_or_404(MovieTVShow, id=movie_id)
+    movie = get_object_or_404(MovieTVShow.objects.only('id'), id=movie_id)
     
-    # получаем допданные
-    reviews = movie.reviews.select_related('user').order_by('-created_at')[:10]
-    ratings = movie.ratings.select_related('user').order_by('-created_at')[:10]
-    actors = movie.actors_directors.filter(movie_roles__role='actor')[:10]
-    directors = movie.actors_directors.filter(movie_roles__role='director')[:5]
+    # данные для отчета выбирает воркер, администратор попадает на страницу статуса
+    try:
+        task_id = submit_pdf_report(render_movie_report, f'movie_report_{movie.id}', movie.id)
+    except OperationalError:
+        messages.error(request, PDF_QUEUE_UNAVAILABLE_MESSAGE)
+        return HttpResponseRedirect(reverse('admin:movies_movietvshow_change', args=[movie.id]))
     
+    return HttpResponseRedirect(reverse('admin_pdf_report_status', args=[task_id]))
+
+
+@staff_member_required
+def admin_pdf_report_status(request, task_id):
+    """Страница статуса фоновой генерации PDF отчета; готовый отчет отдается как PDF"""
+    if not is_valid_task_id(task_id):
+        raise Http404('Отчет не найден')
+    
+    status = get_report_status(task_id)
+    
+    if status is None:
+        raise Http404('Отчет не найден или удален по истечении срока хранения')
+    
+    if status == REPORT_READY:
+        # FileResponse отдает файл через wsgi.file_wrapper (sendfile), если сервер его поддерживает
+        response = FileResponse(
+            open(get_report_path(task_id), 'rb'),
+            content_type='application/pdf',
+            filename=f'{task_id.rsplit("-", 1)[0]}.pdf'
+        )
+        response.block_size = REPORT_CHUNK_SIZE
+        return response
+    
+    # пока отчет формируется, страница обновляется через meta refresh;
+    # неудачная генерация - штатный результат задачи, а не ошибка сервера
     context = {
-        'movie': movie,
-        'reviews': reviews,
-        'ratings': ratings,
-        'actors': actors,
-        'directors': directors,
-        'reviews_count': movie.reviews.count(),
-        'ratings_count': movie.ratings.count(),
-        'average_rating': movie.ratings.aggregate(avg=Avg('rating_value'))['avg'] or 0,
+        'task_id': task_id,
+        'status': status,
+        'refresh_interval': 2,
+        'site_title': admin.site.site_title,
+        'site_header': admin.site.site_header,
     }
-    
-    # рендерим HTML шаблон
-    html = render_to_string('admin/movies/movie_pdf_report.html', context)
-    
-    # создаем HTTP ответ с PDF
-    response = HttpResponse(content_type='application/pdf')
-    response['Content-Disposition'] = f'filename=movie_report_{movie.id}_{movie.title[:20]}.pdf'
-    
-    # генерация PDF с помощью WeasyPrint
-    weasyprint.HTML(string=html).write_pdf(response)
-    
-    return response
+    return render(request, 'admin/movies/pdf_report_status.html', context)
@@ -28,13 +28,24 @@ urlpatterns: List[URLPattern] = [
     # === КОРНЕВОЙ ЭНДПОИНТ API ===
     path('', api_views.api_root, name='api-root'),
 
+    # Наиболее часто запрашиваемые маршруты идут первыми
     # === ГЛАВНАЯ СТРАНИЦА И ПОИСК ===
     # Данные для главной страницы (для React)
     path('homepage/', homepage_data, name='api_homepage'),
-    # Поиск фильмов (упрощенный)
-    path('search/', search_movies, name='api_search_movies'),
     # Детальная информация о фильме (упрощенная)
     path('movie/<int:movie_id>/', movie_detail_api, name='api_movie_detail_simple'),
+    # Поиск фильмов (упрощенный)
+    path('search/', search_movies, name='api_search'),
+    
+    # === ФИЛЬМЫ И СЕРИАЛЫ ===
+    # Список фильмов/сериалов (с фильтрацией)
+    path('movies/', MovieTVShowListAPIView.as_view(), name='api_movie_list'),
+    # Детальная информация о фильме/сериале
+    path('movies/<int:pk>/', MovieTVShowDetailAPIView.as_view(), name='api_movie_detail'),
+    # Поиск фильмов (расширенный)
+    path('movies/search/', search_movies_api, name='api_movie_search'),
+    # Статистика фильмов
+    path('movies/statistics/', movie_statistics_api, name='api_movie_statistics'),
     
     # === АВТОРИЗАЦИЯ И ПРОФИЛЬ ===
     # Регистрация пользователя
@@ -60,19 +71,7 @@ urlpatterns: List[URLPattern] = [
     # Список отзывов на модерации
     path('admin/pending-reviews/', pending_reviews_api, name='api_pending_reviews'),
     
-    # === ФИЛЬМЫ И СЕРИАЛЫ ===
-    # Список фильмов/сериалов (с фильтрацией)
-    path('movies/', MovieTVShowListAPIView.as_view(), name='api_movie_list'),
-    # Детальная информация о фильме/сериале
-    path('movies/<int:pk>/', MovieTVShowDetailAPIView.as_view(), name='api_movie_detail'),
-    # Поиск фильмов (расширенный)
-    path('movies/search/', search_movies_api, name='api_movie_search'),
-    # Статистика фильмов
-    path('movies/statistics/', movie_statistics_api, name='api_movie_statistics'),
-    
-    # === ПОИСК И СТАТИСТИКА ===
-    # Поиск фильмов (альтернативный маршрут)
-    path('search/', search_movies_api, name='api_search'),
+    # === СТАТИСТИКА ===
     # Статистика (альтернативный маршрут)
     path('statistics/', movie_statistics_api, name='api_statistics'),
     
@@ -1,47 +1,106 @@
 from rest_framework import generics, status, filters
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
-from rest_framework.permissions import IsAuthenticated, IsAdminUser
+from rest_framework.pagination import CursorPagination
+from rest_framework.permissions import IsAuthenticated, IsAuthenticatedOrReadOnly, IsAdminUser
 from django_filters.rest_framework import DjangoFilterBackend
-from django.db.models import Avg, Count, Q, QuerySet
+from django.db.models import (
+    BooleanField, Case, Count, Exists, OuterRef, Q, QuerySet, Value, When, prefetch_related_objects
+)
 from django.utils import timezone
 from datetime import timedelta
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Dict, FrozenSet, List, Optional, Type
+import uuid
 from rest_framework.request import Request
 from rest_framework.serializers import Serializer
 from rest_framework.views import APIView
-from django.http import HttpRequest
-from .models import MovieTVShow, Genre, ActorDirector, Review, Rating, Recommendation
+from django.http import HttpRequest, JsonResponse
+from django.core.cache import cache
+from django.contrib.postgres.search import SearchQuery
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition, require_GET
+from .models import (
+    MovieTVShow, MovieTVShowActorDirector, Genre, ActorDirector, Review, Rating, Recommendation,
+    GenreMovieCount, ActorDirectorMovieCount
+)
 from .serializers import (
     MovieTVShowSerializer, MovieTVShowListSerializer, MovieTVShowCreateSerializer, GenreSerializer,
     ActorDirectorSerializer, ReviewSerializer, RatingSerializer, RecommendationSerializer
 )
+from .pagination import paginate_by_created_at
 from .filters import (
     MovieTVShowFilter, ReviewFilter, RatingFilter,
-    GenreFilter, ActorDirectorFilter
+    GenreFilter, ActorDirectorFilter, TrigramSearchFilter
 )
 from rest_framework.reverse import reverse
 
 
-@api_view(['GET'])
-def api_root(request: HttpRequest, format: str = None) -> Response:
+# Эндпоинты, перечисляемые корнем API
+API_ROOT_URL_NAMES = (
+    ('homepage', 'api_homepage'),
+    ('movies', 'api_movie_list'),
+    ('genres', 'api_genre_list'),
+    ('actors', 'api_actor_list'),
+    ('reviews', 'api_review_list'),
+    ('ratings', 'api_rating_list'),
+    ('recommendations', 'api_recommendation_list'),
+    ('search', 'api_search'),
+    ('profile', 'api_profile'),
+    ('collections', 'api_collections'),
+)
+API_ROOT_CACHE_TIMEOUT = 3600
+
+
+@require_GET
+def api_root(request: HttpRequest) -> JsonResponse:
     """
     Корневой эндпоинт API.
 
-    Предоставляет список доступных эндпоинтов.
+    Предоставляет список доступных эндпоинтов. Набор URL зависит только
+    от схемы и хоста, поэтому он кэшируется и отдается без согласования
+    рендереров DRF.
     """
-    return Response({
-        'homepage': reverse('api_homepage', request=request, format=format),
-        'movies': reverse('api_movie_list', request=request, format=format),
-        'genres': reverse('api_genre_list', request=request, format=format),
-        'actors': reverse('api_actor_list', request=request, format=format),
-        'reviews': reverse('api_review_list', request=request, format=format),
-        'ratings': reverse('api_rating_list', request=request, format=format),
-        'recommendations': reverse('api_recommendation_list', request=request, format=format),
-        'search': reverse('api_search_movies', request=request, format=format),
-        'profile': reverse('api_profile', request=request, format=format),
-        'collections': reverse('api_collections', request=request, format=format),
-    })
+    def build_urls() -> Dict[str, str]:
+        return {
+            key: request.build_absolute_uri(reverse(url_name))
+            for key, url_name in API_ROOT_URL_NAMES
+        }
+
+    urls = cache.get_or_set(
+        f'api_root:{request.scheme}:{request.get_host()}',
+        build_urls,
+        API_ROOT_CACHE_TIMEOUT
+    )
+    return JsonResponse(urls)
+
+
+# Выделенные фильмы (общие для всех запросов)
+HIGHLIGHTED_MOVIES: FrozenSet[int] = frozenset((1, 3, 5, 7))
+STATISTICS_HIGHLIGHTED_MOVIES: FrozenSet[int] = frozenset((1, 3, 5))
+
+
+def highlighted_annotation(movie_ids: FrozenSet[int]) -> Case:
+    """
+    Выражение для аннотации признака выделенного фильма.
+    Args:
+        movie_ids: Идентификаторы выделенных фильмов
+    Returns:
+        Case: Выражение is_highlighted для annotate()
+    """
+    return Case(
+        When(pk__in=movie_ids, then=Value(True)),
+        default=Value(False),
+        output_field=BooleanField()
+    )
+
+
+# Поля модели, используемые MovieTVShowListSerializer
+MOVIE_LIST_FIELDS = (
+    'id', 'title', 'type', 'release_date', 'duration', 'poster_url', 'avg_rating', 'reviews_count'
+)
+
+# Размер страницы расширенного поиска
+SEARCH_PAGE_SIZE = 50
 
 
 class MovieTVShowListAPIView(generics.ListCreateAPIView):
@@ -51,7 +110,7 @@ class MovieTVShowListAPIView(generics.ListCreateAPIView):
     """
     queryset = MovieTVShow.objects.all()
     serializer_class = MovieTVShowSerializer
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [DjangoFilterBackend, filters.OrderingFilter, TrigramSearchFilter]
     filterset_class = MovieTVShowFilter
     search_fields = ['title', 'description']
     ordering_fields = ['release_date', 'title', 'created_at']
@@ -73,14 +132,9 @@ class MovieTVShowListAPIView(generics.ListCreateAPIView):
         Returns:
             QuerySet: Queryset фильмов/сериалов
         """
-        queryset = MovieTVShow.objects.prefetch_related(
-            'genres',
-            'reviews',
-            'ratings'
-        ).annotate(
-            avg_rating=Avg('ratings__rating_value'),
-            review_count=Count('reviews'),
-            rating_count=Count('ratings')
+        # средняя оценка и счетчики хранятся в самой таблице фильмов
+        queryset = MovieTVShow.objects.only(*MOVIE_LIST_FIELDS).prefetch_related('genres').annotate(
+            is_highlighted=highlighted_annotation(HIGHLIGHTED_MOVIES)
         )
 
         # Фильтрация по году
@@ -91,21 +145,9 @@ class MovieTVShowListAPIView(generics.ListCreateAPIView):
         # Фильтрация по минимальному рейтингу
         min_rating = self.request.query_params.get('min_rating')
         if min_rating:
-            queryset = queryset.filter(ratings__rating_value__gte=min_rating)
+            queryset = queryset.filter(avg_rating__gte=min_rating)
 
         return queryset
-    
-    def get_serializer_context(self) -> Dict[str, Any]:
-        """
-        Передача контекста с выделенными фильмами.
-        Returns:
-            dict: Контекст для сериализатора
-        """
-        context = super().get_serializer_context()
-        highlighted_movies: List[int] = [1, 3, 5, 7] 
-        context['highlighted_movies'] = highlighted_movies
-        
-        return context
 
 
 class MovieTVShowDetailAPIView(generics.RetrieveUpdateDestroyAPIView):
@@ -121,24 +163,9 @@ class MovieTVShowDetailAPIView(generics.RetrieveUpdateDestroyAPIView):
         Returns:
             QuerySet: Queryset фильмов/сериалов
         """
-        return MovieTVShow.objects.select_related().prefetch_related(
-            'genres', 'reviews__user', 'ratings'
-        ).annotate(
-            avg_rating=Avg('ratings__rating_value'),
-            reviews_count=Count('reviews'),
-            ratings_count=Count('ratings')
+        return MovieTVShow.objects.prefetch_related('genres').annotate(
+            is_highlighted=highlighted_annotation(HIGHLIGHTED_MOVIES)
         )
-    
-    def get_serializer_context(self) -> Dict[str, Any]:
-        """
-        Передача контекста для сериализатора.
-        Returns:
-            dict: Контекст для сериализатора
-        """
-        context = super().get_serializer_context()
-        highlighted_movies: List[int] = [1, 3, 5, 7]
-        context['highlighted_movies'] = highlighted_movies
-        return context
 
 
 class GenreListAPIView(generics.ListCreateAPIView):
@@ -158,7 +185,7 @@ class GenreListAPIView(generics.ListCreateAPIView):
             QuerySet: Queryset жанров
         """
         return Genre.objects.annotate(
-            movies_count=Count('movies')
+            movies_count=GenreMovieCount.subquery()
         ).order_by('name')
 
 
@@ -168,7 +195,7 @@ class ActorDirectorListAPIView(generics.ListCreateAPIView):
     """
     queryset = ActorDirector.objects.all()
     serializer_class = ActorDirectorSerializer
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [DjangoFilterBackend, filters.OrderingFilter, TrigramSearchFilter]
     filterset_class = ActorDirectorFilter
     search_fields = ['full_name', 'biography']
     ordering_fields = ['full_name', 'birth_date']
@@ -180,8 +207,10 @@ class ActorDirectorListAPIView(generics.ListCreateAPIView):
         Returns:
             QuerySet: Queryset актеров/режиссеров
         """
-        return ActorDirector.objects.annotate(
-            movies_count=Count('movies')
+        return ActorDirector.objects.only(
+            'id', 'full_name', 'birth_date', 'biography', 'photo_url'
+        ).annotate(
+            movies_count=ActorDirectorMovieCount.subquery()
         )
 
 
@@ -189,6 +218,7 @@ class ReviewListAPIView(generics.ListCreateAPIView):
     """
     API для списка и создания отзывов.
     """
+    permission_classes = [IsAuthenticatedOrReadOnly]
     serializer_class = ReviewSerializer
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
     filterset_class = ReviewFilter
@@ -198,12 +228,19 @@ class ReviewListAPIView(generics.ListCreateAPIView):
     def get_queryset(self) -> QuerySet:
         """
         Queryset с предзагрузкой связанных объектов.
+        Лайки и дизлайки считаются в том же запросе, что и список отзывов,
+        вместо отдельных COUNT по голосам для каждого отзыва.
         Returns:
             QuerySet: Queryset отзывов
         """
         return Review.objects.select_related(
             'user', 'movie_tvshow'
-        ).prefetch_related('votes')
+        ).only(
+            'id', 'review_text', 'created_at', 'user__username', 'movie_tvshow__title'
+        ).annotate(
+            vote_likes=Count('votes', filter=Q(votes__vote_type='like')),
+            vote_dislikes=Count('votes', filter=Q(votes__vote_type='dislike'))
+        )
     
     def perform_create(self, serializer: Serializer) -> None:
         """
@@ -211,9 +248,16 @@ class ReviewListAPIView(generics.ListCreateAPIView):
         Args:
             serializer: Сериализатор отзыва
         """
-        from django.contrib.auth.models import User
-        user = self.request.user if self.request.user.is_authenticated else User.objects.first()
-        serializer.save(user=user)
+        serializer.save(user=self.request.user)
+
+
+class RecommendationCursorPagination(CursorPagination):
+    """
+    Курсорная пагинация рекомендаций: страница выбирается по created_at
+    без OFFSET, в памяти находится только одна страница.
+    """
+    page_size = 20
+    ordering = '-created_at'
 
 
 class RecommendationListAPIView(generics.ListAPIView):
@@ -222,6 +266,42 @@ class RecommendationListAPIView(generics.ListAPIView):
     Возвращает рекомендации для текущего пользователя, либо создает демо-рекомендации.
     """
     serializer_class = RecommendationSerializer
+    pagination_class = RecommendationCursorPagination
+    
+    def list(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        """
+        Список рекомендаций; демо-рекомендации создаются один раз до выборки,
+        а не внутри get_queryset, который может вызываться несколько раз.
+        Returns:
+            Response: DRF Response со списком рекомендаций
+        """
+        if request.user.is_authenticated:
+            self._seed_demo_recommendations(request.user)
+        return super().list(request, *args, **kwargs)
+    
+    def _seed_demo_recommendations(self, user: Any) -> None:
+        """
+        Создание демо-рекомендаций, если у пользователя их еще нет.
+        Args:
+            user: Текущий пользователь
+        """
+        if Recommendation.objects.filter(user=user).exists():
+            return
+        
+        # Берем топ-рейтинговые фильмы как рекомендации
+        top_movies = MovieTVShow.objects.only('id', 'avg_rating').filter(
+            ratings_count__gte=3
+        ).order_by('-avg_rating')[:5]
+        
+        # Одна вставка вместо get_or_create на каждый фильм
+        Recommendation.objects.bulk_create([
+            Recommendation(
+                user=user,
+                movie_tvshow=movie,
+                reason_code=f'high_rating_{movie.avg_rating:.1f}'
+            )
+            for movie in top_movies
+        ], ignore_conflicts=True)
     
     def get_queryset(self) -> QuerySet:
         """
@@ -230,40 +310,11 @@ class RecommendationListAPIView(generics.ListAPIView):
             QuerySet: Queryset рекомендаций
         """
         if self.request.user.is_authenticated:
-            recommendations = Recommendation.objects.filter(
+            return Recommendation.objects.filter(
                 user=self.request.user
             ).select_related('movie_tvshow').prefetch_related(
                 'movie_tvshow__genres'
             ).order_by('-created_at')
-            
-            # Если рекомендаций нет, создаем демо-рекомендации
-            if not recommendations.exists():
-                from django.contrib.auth.models import User
-                user = self.request.user
-                
-                # Берем топ-рейтинговые фильмы как рекомендации
-                top_movies = MovieTVShow.objects.annotate(
-                    avg_rating=Avg('ratings__rating_value'),
-                    ratings_count=Count('ratings')
-                ).filter(ratings_count__gte=3).order_by('-avg_rating')[:5]
-                
-                for movie in top_movies:
-                    Recommendation.objects.get_or_create(
-                        user=user,
-                        movie_tvshow=movie,
-                        defaults={
-                            'reason_code': f'high_rating_{movie.avg_rating:.1f}' if hasattr(movie, 'avg_rating') else 'high_rating'
-                        }
-                    )
-                
-                # Обновляем queryset
-                recommendations = Recommendation.objects.filter(
-                    user=self.request.user
-                ).select_related('movie_tvshow').prefetch_related(
-                    'movie_tvshow__genres'
-                ).order_by('-created_at')
-            
-            return recommendations
         return Recommendation.objects.none()
 
 
@@ -271,6 +322,7 @@ class RatingListAPIView(generics.ListCreateAPIView):
     """
     API для списка и создания рейтингов.
     """
+    permission_classes = [IsAuthenticatedOrReadOnly]
     serializer_class = RatingSerializer
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
     filterset_class = RatingFilter
@@ -285,6 +337,8 @@ class RatingListAPIView(generics.ListCreateAPIView):
         """
         return Rating.objects.select_related(
             'user', 'movie_tvshow'
+        ).only(
+            'id', 'rating_value', 'created_at', 'user__username', 'movie_tvshow__title'
         )
     
     def perform_create(self, serializer: Serializer) -> None:
@@ -294,98 +348,113 @@ class RatingListAPIView(generics.ListCreateAPIView):
         Args:
             serializer: Сериализатор рейтинга
         """
-        from django.contrib.auth.models import User
-        user = self.request.user if self.request.user.is_authenticated else User.objects.first()
-        
-        # Проверяем, есть ли уже рейтинг от этого пользователя для этого фильма
-        movie_tvshow = serializer.validated_data['movie_tvshow']
-        existing_rating = Rating.objects.filter(user=user, movie_tvshow=movie_tvshow).first()
-        
-        if existing_rating:
-            # Обновляем существующий рейтинг
-            existing_rating.rating_value = serializer.validated_data['rating_value']
-            existing_rating.save()
-            # Возвращаем обновленный объект
-            serializer.instance = existing_rating
-        else:
-            # Создаем новый рейтинг
-            serializer.save(user=user)
+        # Атомарное создание или обновление по уникальной паре (user, movie_tvshow)
+        rating, _ = Rating.objects.update_or_create(
+            user=self.request.user,
+            movie_tvshow=serializer.validated_data['movie_tvshow'],
+            defaults={'rating_value': serializer.validated_data['rating_value']}
+        )
+        serializer.instance = rating
 
 
+# Ключ и время жизни кэша статистики фильмов
+MOVIE_STATISTICS_CACHE_KEY = 'movie_stats_v1'
+MOVIE_STATISTICS_CACHE_TIMEOUT = 60
+
+# Ключ версии данных каталога, используемой в ETag (в общем кэше)
+CATALOG_ETAG_CACHE_KEY = 'catalog_etag_v1'
+
+
+def catalog_etag(request: HttpRequest, *args: Any, **kwargs: Any) -> str:
+    """
+    ETag для ответов, построенных по данным каталога.
+    Версия меняется при изменении данных каталога (см. signals.py), дата учитывается
+    из-за списков новинок. Версия хранится в общем кэше (Redis, см. CACHES),
+    поэтому сброс в одном процессе виден всем процессам веб-сервера.
+    Args:
+        request: HTTP запрос
+    Returns:
+        str: Значение ETag
+    """
+    version = cache.get_or_set(CATALOG_ETAG_CACHE_KEY, lambda: uuid.uuid4().hex, None)
+    return f'{version}-{timezone.now().date().isoformat()}'
+
+
+@cache_control(public=True, max_age=MOVIE_STATISTICS_CACHE_TIMEOUT)
+@condition(etag_func=catalog_etag)
 @api_view(['GET'])
 def movie_statistics_api(request: Request) -> Response:
     """
     API для статистики фильмов.
     Возвращает общую статистику, топ-рейтинговые, самые обсуждаемые и новые фильмы.
+    Данные кэшируются и сбрасываются при изменении фильмов, отзывов и рейтингов.
     Args:
         request: Запрос DRF
     Returns:
         Response: DRF Response с данными статистики
     """
-    # Общая статистика
-    total_movies = MovieTVShow.objects.filter(type='movie').count()
-    total_tv_shows = MovieTVShow.objects.filter(type='tv_show').count()
-    total_genres = Genre.objects.count()
-    total_actors = ActorDirector.objects.count()
-    
-    # Топ-рейтинговые фильмы с аннотациями
-    top_rated = MovieTVShow.objects.annotate(
-        avg_rating=Avg('ratings__rating_value'),
-        ratings_count=Count('ratings')
-    ).filter(ratings_count__gte=3).order_by('-avg_rating')[:10]
+    return Response(cache.get_or_set(
+        MOVIE_STATISTICS_CACHE_KEY,
+        _build_movie_statistics,
+        MOVIE_STATISTICS_CACHE_TIMEOUT
+    ))
+
+
+def _build_movie_statistics() -> Dict[str, Any]:
+    """
+    Расчет данных статистики фильмов.
+    Returns:
+        dict: Общая статистика и сериализованные топы фильмов
+    """
+    # Общая статистика каталога считается одним запросом
+    counts = MovieTVShow.objects.catalog_counts(total_actors=ActorDirector.objects.all())
     
-    # Самые обсуждаемые фильмы
-    most_reviewed = MovieTVShow.objects.annotate(
-        reviews_count=Count('reviews')
-    ).order_by('-reviews_count')[:10]
+    # Топы строятся по денормализованным полям, без агрегации по оценкам и отзывам
+    movies = MovieTVShow.objects.only(*MOVIE_LIST_FIELDS).annotate(
+        is_highlighted=highlighted_annotation(STATISTICS_HIGHLIGHTED_MOVIES)
+    )
+    top_rated = list(movies.filter(ratings_count__gte=3).order_by('-avg_rating')[:10])
+    most_reviewed = list(movies.order_by('-reviews_count')[:10])
     
     # Новинки (за последние 30 дней)
-    from datetime import timedelta
-    
-    new_releases = MovieTVShow.objects.filter(
+    new_releases = list(movies.filter(
         release_date__gte=timezone.now().date() - timedelta(days=30)
-    ).order_by('-release_date')[:10]
-    
-    # Сериализация данных
-    top_rated_data = MovieTVShowListSerializer(
-        top_rated, 
-        many=True, 
-        context={'highlighted_movies': [1, 3, 5]}
-    ).data
+    ).order_by('-release_date')[:10])
     
-    most_reviewed_data = MovieTVShowListSerializer(
-        most_reviewed, 
-        many=True,
-        context={'highlighted_movies': [1, 3, 5]}
-    ).data
+    # Фильмы из всех трех списков (без повторов) загружают жанры одним запросом
+    # и сериализуются одним вызовом сериализатора
+    unique_movies = list({movie.pk: movie for movie in top_rated + most_reviewed + new_releases}.values())
+    prefetch_related_objects(unique_movies, 'genres')
+    movies_data = MovieTVShowListSerializer(unique_movies, many=True).data
+    data_by_id = {item['id']: item for item in movies_data}
     
-    new_releases_data = MovieTVShowListSerializer(
-        new_releases, 
-        many=True,
-        context={'highlighted_movies': [1, 3, 5]}
-    ).data
-    
-    return Response({
+    return {
         'statistics': {
-            'total_movies': total_movies,
-            'total_tv_shows': total_tv_shows,
-            'total_genres': total_genres,
-            'total_actors': total_actors,
+            'total_movies': counts['total_movies'],
+            'total_tv_shows': counts['total_tv_shows'],
+            'total_genres': counts['total_genres'],
+            'total_actors': counts['total_actors'],
         },
-        'top_rated': top_rated_data,
-        'most_reviewed': most_reviewed_data,
-        'new_releases': new_releases_data,
-    })
+        'top_rated': [data_by_id[movie.pk] for movie in top_rated],
+        'most_reviewed': [data_by_id[movie.pk] for movie in most_reviewed],
+        'new_releases': [data_by_id[movie.pk] for movie in new_releases],
+    }
 
 
 @api_view(['GET'])
 def search_movies_api(request: Request) -> Response:
     """
     API для поиска фильмов с расширенными фильтрами.
+
+    Результаты отдаются страницами по SEARCH_PAGE_SIZE в порядке
+    (created_at, id) по убыванию. Общее количество найденных фильмов
+    не считается (поля 'count' в ответе нет): клиент проверяет 'has_next'
+    и передает 'next_cursor' в параметре cursor для следующей страницы.
+    На некорректный курсор возвращается ответ 400.
     Args:
         request: Запрос DRF
     Returns:
-        Response: DRF Response с результатами поиска
+        Response: DRF Response с полями results, has_next, next_cursor и filters_applied
     """
     # Получаем параметры поиска
     query: str = request.GET.get('q', '')
@@ -395,24 +464,26 @@ def search_movies_api(request: Request) -> Response:
     min_rating: str = request.GET.get('min_rating', '')
     
     # Базовый queryset с оптимизацией
-    movies = MovieTVShow.objects.select_related().prefetch_related(
-        'genres', 'actors_directors'
-    ).annotate(
-        avg_rating=Avg('ratings__rating_value'),
-        reviews_count=Count('reviews'),
-        ratings_count=Count('ratings')
+    movies = MovieTVShow.objects.only(*MOVIE_LIST_FIELDS, 'created_at').prefetch_related('genres').annotate(
+        is_highlighted=highlighted_annotation(HIGHLIGHTED_MOVIES)
     )
     
-    # Применяем фильтры
+    # Применяем фильтры: название и описание ищутся по полнотекстовому индексу,
+    # связи проверяются через EXISTS, чтобы строки не дублировались без DISTINCT
     if query:
         movies = movies.filter(
-            Q(title__icontains=query) | 
-            Q(description__icontains=query) |
-            Q(actors_directors__full_name__icontains=query)
-        ).distinct()
+            Q(search_vector=SearchQuery(query, config='simple')) |
+            Exists(MovieTVShowActorDirector.objects.filter(
+                movie_tvshow=OuterRef('pk'),
+                actor_director__full_name__icontains=query
+            ))
+        )
     
     if genre_ids:
-        movies = movies.filter(genres__id__in=genre_ids).distinct()
+        movies = movies.filter(Exists(MovieTVShow.genres.through.objects.filter(
+            movietvshow=OuterRef('pk'),
+            genre__in=genre_ids
+        )))
     
     if type_filter:
         movies = movies.filter(type=type_filter)
@@ -423,16 +494,18 @@ def search_movies_api(request: Request) -> Response:
     if min_rating:
         movies = movies.filter(avg_rating__gte=float(min_rating))
     
-    # Сериализация с контекстом
-    serializer = MovieTVShowListSerializer(
-        movies[:50],  # Ограничиваем результаты
-        many=True,
-        context={'highlighted_movies': [1, 3, 5, 7]}
-    )
+    # Keyset-пагинация по (created_at, id) без подсчета всех найденных строк
+    try:
+        results, next_cursor = paginate_by_created_at(movies, request.GET.get('cursor'), SEARCH_PAGE_SIZE)
+    except ValueError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    
+    serializer = MovieTVShowListSerializer(results, many=True)
     
     return Response({
         'results': serializer.data,
-        'count': movies.count(),
+        'has_next': next_cursor is not None,
+        'next_cursor': next_cursor,
         'filters_applied': {
             'query': query,
             'genres': genre_ids,
@@ -1,14 +1,102 @@
 from django.contrib.auth import authenticate, login, logout
 from django.contrib.auth.models import User
+from django.conf import settings
+from django.core.cache import cache
 from django.http import JsonResponse, HttpRequest, HttpResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
+from django.db import transaction
+from django.db.models import Count
+from django.db.models.functions import Substr
 from .models import Collection, CollectionItem, MovieTVShow, Review, Rating, Recommendation, Genre, UserProfile
 from .forms import CustomUserCreationForm
-from typing import Any, Dict, Optional
+from .pagination import paginate_by_created_at
+from typing import Any, Callable, Dict, Optional, Tuple
+from functools import wraps
+from itertools import islice
+from operator import attrgetter
 import json
 
 
+# Сколько топ-рейтинговых фильмов рассматривается при генерации рекомендаций
+RECOMMENDATION_CANDIDATES_LIMIT = 50
+# Размер пачки при чтении пользователей и вставке рекомендаций
+RECOMMENDATION_BATCH_SIZE = 1000
+
+# Длина превью отзыва в админ-панели
+REVIEW_PREVIEW_LENGTH = 100
+
+# Кэш данных админ-панели
+ADMIN_DASHBOARD_CACHE_KEY = 'admin_dashboard_v1'
+ADMIN_DASHBOARD_CACHE_TIMEOUT = 60
+
+# Размер страницы списков по умолчанию и максимальный
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 100
+
+
+def get_page_size(request: HttpRequest) -> int:
+    """
+    Размер страницы из параметра limit.
+    Args:
+        request: HttpRequest
+    Returns:
+        int: Размер страницы в пределах 1..MAX_PAGE_SIZE
+    """
+    try:
+        limit = int(request.GET.get('limit', DEFAULT_PAGE_SIZE))
+    except ValueError:
+        return DEFAULT_PAGE_SIZE
+    return max(1, min(limit, MAX_PAGE_SIZE))
+
+
+# Поля пользователя в ответе регистрации (без признаков прав доступа)
+PUBLIC_USER_FIELDS = ('id', 'username', 'email', 'first_name', 'last_name')
+# Поля пользователя в ответах входа и профиля
+USER_FIELDS = PUBLIC_USER_FIELDS + ('is_staff', 'is_superuser')
+_USER_FIELD_GETTERS = {fields: attrgetter(*fields) for fields in (PUBLIC_USER_FIELDS, USER_FIELDS)}
+
+
+def _user_to_dict(user: User, fields: Tuple[str, ...] = USER_FIELDS) -> Dict[str, Any]:
+    """
+    Данные пользователя для ответа API.
+    Args:
+        user: Пользователь
+        fields: Набор полей (PUBLIC_USER_FIELDS или USER_FIELDS)
+    Returns:
+        dict: Значения полей fields
+    """
+    return dict(zip(fields, _USER_FIELD_GETTERS[fields](user)))
+
+
+def admin_api_required(view_func: Callable[..., JsonResponse]) -> Callable[..., JsonResponse]:
+    """
+    Декоратор для административных API.
+    Отклоняет неавторизованные запросы и запросы без прав администратора
+    до выполнения представления и любых обращений к БД.
+    Args:
+        view_func: Представление
+    Returns:
+        Callable: Обернутое представление
+    """
+    @wraps(view_func)
+    def wrapper(request: HttpRequest, *args: Any, **kwargs: Any) -> JsonResponse:
+        if not request.user.is_authenticated:
+            return JsonResponse({
+                'success': False,
+                'error': 'Необходима авторизация'
+            }, status=401)
+        
+        if not (request.user.is_staff or request.user.is_superuser):
+            return JsonResponse({
+                'success': False,
+                'error': 'Доступ запрещен. Требуются права администратора.'
+            }, status=403)
+        
+        return view_func(request, *args, **kwargs)
+    return wrapper
+
+
 @csrf_exempt
 @require_http_methods(["POST"])
 def register_api(request: HttpRequest) -> JsonResponse:
@@ -25,19 +113,14 @@ def register_api(request: HttpRequest) -> JsonResponse:
         form = CustomUserCreationForm(data)
         
         if form.is_valid():
-            user = form.save()
-            # Создаем профиль пользователя
-            UserProfile.objects.create(user=user)
+            # Пользователь и профиль создаются в одной транзакции
+            with transaction.atomic():
+                user = form.save()
+                UserProfile.objects.create(user=user)
             
             return JsonResponse({
                 'success': True,
-                'user': {
-                    'id': user.id,
-                    'username': user.username,
-                    'email': user.email,
-                    'first_name': user.first_name,
-                    'last_name': user.last_name
-                }
+                'user': _user_to_dict(user, PUBLIC_USER_FIELDS)
             })
         else:
             return JsonResponse({
@@ -79,22 +162,20 @@ def login_api(request: HttpRequest) -> JsonResponse:
                 'error': 'Имя пользователя и пароль обязательны'
             }, status=400)
         
-        user = authenticate(request, username=username, password=password)
+        # При включенной настройке неизвестные имена отклоняются без
+        # вычисления хэша пароля (ценой защиты от перебора имен по времени ответа)
+        user = None
+        if not settings.LOGIN_FAST_FAIL_UNKNOWN_USERS or User.objects.filter(
+            username=username, is_active=True
+        ).exists():
+            user = authenticate(request, username=username, password=password)
         
         if user is not None:
             login(request, user)
             return JsonResponse({
                 'success': True,
                 'message': 'Успешный вход в систему',
-                'user': {
-                    'id': user.id,
-                    'username': user.username,
-                    'email': user.email,
-                    'first_name': user.first_name,
-                    'last_name': user.last_name,
-                    'is_staff': user.is_staff,
-                    'is_superuser': user.is_superuser
-                }
+                'user': _user_to_dict(user)
             })
         else:
             return JsonResponse({
@@ -158,20 +239,14 @@ def profile_api(request: HttpRequest) -> JsonResponse:
         JsonResponse: Данные профиля пользователя
     """
     try:
-        if request.user.is_authenticated:
+        user = request.user
+        if user.is_authenticated:
+            user_data = _user_to_dict(user)
+            user_data['date_joined'] = user.date_joined.isoformat()
+            user_data['last_login'] = user.last_login.isoformat() if user.last_login else None
             return JsonResponse({
                 'success': True,
-                'user': {
-                    'id': request.user.id,
-                    'username': request.user.username,
-                    'email': request.user.email,
-                    'first_name': request.user.first_name,
-                    'last_name': request.user.last_name,
-                    'is_staff': request.user.is_staff,
-                    'is_superuser': request.user.is_superuser,
-                    'date_joined': request.user.date_joined.isoformat(),
-                    'last_login': request.user.last_login.isoformat() if request.user.last_login else None
-                }
+                'user': user_data
             })
         else:
             return JsonResponse({
@@ -191,7 +266,8 @@ def profile_api(request: HttpRequest) -> JsonResponse:
 def collections_api(request: HttpRequest) -> JsonResponse:
     """
     API для работы с подборками.
-    GET: возвращает список подборок.
+    GET: возвращает страницу подборок (параметры cursor и limit); курсор
+    следующей страницы приходит в поле next_cursor, на последней странице он равен null.
     POST: создает новую подборку для авторизованного пользователя.
     Args:
         request: HttpRequest
@@ -200,24 +276,40 @@ def collections_api(request: HttpRequest) -> JsonResponse:
     """
     try:
         if request.method == 'GET':
-            # Получение списка подборок
-            collections = Collection.objects.all().order_by('-created_at')
+            # Получение списка подборок: автор и количество фильмов
+            # загружаются одним запросом с JOIN и GROUP BY
+            try:
+                collections, next_cursor = paginate_by_created_at(
+                    Collection.objects.annotate(movies_count=Count('items')).values(
+                        'id', 'title', 'description', 'is_public', 'created_at',
+                        'user__username', 'movies_count'
+                    ),
+                    request.GET.get('cursor'),
+                    get_page_size(request)
+                )
+            except ValueError as e:
+                return JsonResponse({
+                    'success': False,
+                    'error': str(e)
+                }, status=400)
             
-            collections_data = []
-            for collection in collections:
-                collections_data.append({
-                    'id': collection.id,
-                    'title': collection.title,
-                    'description': collection.description,
-                    'user': collection.user.username if collection.user else 'Система',
-                    'is_public': collection.is_public,
-                    'created_at': collection.created_at.isoformat(),
-                    'movies_count': collection.items.count()
-                })
+            collections_data = [
+                {
+                    'id': collection['id'],
+                    'title': collection['title'],
+                    'description': collection['description'],
+                    'user': collection['user__username'] or 'Система',
+                    'is_public': collection['is_public'],
+                    'created_at': collection['created_at'].isoformat(),
+                    'movies_count': collection['movies_count']
+                }
+                for collection in collections
+            ]
             
             return JsonResponse({
                 'success': True,
-                'collections': collections_data
+                'collections': collections_data,
+                'next_cursor': next_cursor
             })
             
         elif request.method == 'POST':
@@ -270,8 +362,78 @@ def collections_api(request: HttpRequest) -> JsonResponse:
         }, status=500)
 
 
+def _build_admin_dashboard() -> Dict[str, Any]:
+    """
+    Расчет данных админ-панели.
+    Returns:
+        dict: Статистика, последние фильмы, отзывы и топ пользователей
+    """
+    # Статистика каталога и пользователей считается одним запросом
+    stats = MovieTVShow.objects.catalog_counts(
+        total_users=User.objects.filter(is_active=True),
+        total_reviews=Review.objects.all(),
+        total_ratings=Rating.objects.all()
+    )
+    
+    # Последние добавленные фильмы
+    recent_movies = []
+    for movie in MovieTVShow.objects.only(
+        'id', 'title', 'type', 'release_date', 'created_at'
+    ).order_by('-created_at')[:5]:
+        recent_movies.append({
+            'id': movie.id,
+            'title': movie.title,
+            'type': movie.get_type_display(),
+            'release_date': movie.release_date.isoformat(),
+            'created_at': movie.created_at.isoformat()
+        })
+    
+    # Последние отзывы: из БД читается только начало текста
+    # (на символ больше превью, чтобы понять, нужно ли многоточие)
+    recent_reviews = []
+    for review in Review.objects.select_related('user', 'movie_tvshow').only(
+        'id', 'created_at', 'user__username', 'movie_tvshow__title'
+    ).annotate(
+        text_head=Substr('review_text', 1, REVIEW_PREVIEW_LENGTH + 1)
+    ).order_by('-created_at')[:5]:
+        text = review.text_head
+        recent_reviews.append({
+            'id': review.id,
+            'user': review.user.username,
+            'movie': review.movie_tvshow.title,
+            'text_preview': text[:REVIEW_PREVIEW_LENGTH] + '...' if len(text) > REVIEW_PREVIEW_LENGTH else text,
+            'created_at': review.created_at.isoformat()
+        })
+    
+    # Топ пользователей по активности (DISTINCT: соединение с отзывами
+    # и оценками дает их декартово произведение)
+    active_users = []
+    for user in User.objects.only(
+        'id', 'username', 'is_staff', 'is_superuser'
+    ).annotate(
+        reviews_count=Count('reviews', distinct=True),
+        ratings_count=Count('ratings', distinct=True)
+    ).order_by('-reviews_count', '-ratings_count')[:5]:
+        active_users.append({
+            'id': user.id,
+            'username': user.username,
+            'reviews_count': user.reviews_count,
+            'ratings_count': user.ratings_count,
+            'is_staff': user.is_staff,
+            'is_superuser': user.is_superuser
+        })
+    
+    return {
+        'stats': stats,
+        'recent_movies': recent_movies,
+        'recent_reviews': recent_reviews,
+        'active_users': active_users
+    }
+
+
 @csrf_exempt
 @require_http_methods(["GET"])
+@admin_api_required
 def admin_dashboard_api(request: HttpRequest) -> JsonResponse:
     """
     API для админ-панели.
@@ -282,74 +444,16 @@ def admin_dashboard_api(request: HttpRequest) -> JsonResponse:
         JsonResponse: Данные для админ-панели
     """
     try:
-        if not request.user.is_authenticated:
-            return JsonResponse({
-                'success': False,
-                'error': 'Необходима авторизация'
-            }, status=401)
-        
-        if not (request.user.is_staff or request.user.is_superuser):
-            return JsonResponse({
-                'success': False,
-                'error': 'Доступ запрещен. Требуются права администратора.'
-            }, status=403)
-        
-        from django.db.models import Count, Avg
-        
-        # Статистика
-        stats = {
-            'total_movies': MovieTVShow.objects.filter(type='movie').count(),
-            'total_tv_shows': MovieTVShow.objects.filter(type='tv_show').count(),
-            'total_users': User.objects.filter(is_active=True).count(),
-            'total_reviews': Review.objects.count(),
-            'total_ratings': Rating.objects.count(),
-            'total_genres': Genre.objects.count(),
-        }
-        
-        # Последние добавленные фильмы
-        recent_movies = []
-        for movie in MovieTVShow.objects.order_by('-created_at')[:5]:
-            recent_movies.append({
-                'id': movie.id,
-                'title': movie.title,
-                'type': movie.get_type_display(),
-                'release_date': movie.release_date.isoformat(),
-                'created_at': movie.created_at.isoformat()
-            })
         
-        # Последние отзывы
-        recent_reviews = []
-        for review in Review.objects.select_related('user', 'movie_tvshow').order_by('-created_at')[:5]:
-            recent_reviews.append({
-                'id': review.id,
-                'user': review.user.username,
-                'movie': review.movie_tvshow.title,
-                'text_preview': review.review_text[:100] + '...' if len(review.review_text) > 100 else review.review_text,
-                'created_at': review.created_at.isoformat()
-            })
+        # Данные панели кэшируются на короткое время и сбрасываются
+        # сигналами при изменении фильмов, жанров, отзывов и оценок
+        dashboard = cache.get_or_set(
+            ADMIN_DASHBOARD_CACHE_KEY,
+            _build_admin_dashboard,
+            ADMIN_DASHBOARD_CACHE_TIMEOUT
+        )
         
-        # Топ пользователей по активности
-        active_users = []
-        for user in User.objects.annotate(
-            reviews_count=Count('reviews'),
-            ratings_count=Count('ratings')
-        ).order_by('-reviews_count', '-ratings_count')[:5]:
-            active_users.append({
-                'id': user.id,
-                'username': user.username,
-                'reviews_count': user.reviews_count,
-                'ratings_count': user.ratings_count,
-                'is_staff': user.is_staff,
-                'is_superuser': user.is_superuser
-            })
-        
-        return JsonResponse({
-            'success': True,
-            'stats': stats,
-            'recent_movies': recent_movies,
-            'recent_reviews': recent_reviews,
-            'active_users': active_users
-        })
+        return JsonResponse({'success': True, **dashboard})
         
     except Exception as e:
         return JsonResponse({
@@ -360,6 +464,7 @@ def admin_dashboard_api(request: HttpRequest) -> JsonResponse:
 
 @csrf_exempt
 @require_http_methods(["POST"])
+@admin_api_required
 def generate_recommendations_api(request: HttpRequest) -> JsonResponse:
     """
     API для генерации рекомендаций (только для администратора).
@@ -370,51 +475,53 @@ def generate_recommendations_api(request: HttpRequest) -> JsonResponse:
         JsonResponse: Результат генерации
     """
     try:
-        if not request.user.is_authenticated:
-            return JsonResponse({
-                'success': False,
-                'error': 'Необходима авторизация'
-            }, status=401)
-        
-        if not (request.user.is_staff or request.user.is_superuser):
-            return JsonResponse({
-                'success': False,
-                'error': 'Доступ запрещен. Требуются права администратора.'
-            }, status=403)
+        # Кандидаты в рекомендации одинаковы для всех пользователей:
+        # топ-рейтинговые фильмы с минимум 3 оценками
+        candidate_ids = list(MovieTVShow.objects.filter(
+            ratings_count__gte=3
+        ).order_by('-avg_rating').values_list('id', flat=True)[:RECOMMENDATION_CANDIDATES_LIMIT])
         
-        from django.db.models import Count, Avg
-        
-        # Получаем всех активных пользователей
-        users = User.objects.filter(is_active=True)
+        # Пользователи читаются потоком и обрабатываются пачками; оцененные фильмы
+        # и существующие рекомендации загружаются только для пользователей пачки,
+        # так что память ограничена размером пачки, а не числом пользователей
         recommendations_created = 0
-        
-        for user in users:
-            # Получаем топ-рейтинговые фильмы, которые пользователь еще не оценивал
-            top_movies = MovieTVShow.objects.annotate(
-                avg_rating=Avg('ratings__rating_value'),
-                ratings_count=Count('ratings')
-            ).filter(
-                ratings_count__gte=3  # Минимум 3 оценки
-            ).exclude(
-                ratings__user=user  # Исключаем уже оцененные пользователем
-            ).order_by('-avg_rating')[:3]  # Топ-3 фильма
+        users_processed = 0
+        user_ids = User.objects.filter(is_active=True).values_list('id', flat=True).iterator(
+            chunk_size=RECOMMENDATION_BATCH_SIZE
+        )
+        while True:
+            batch_user_ids = list(islice(user_ids, RECOMMENDATION_BATCH_SIZE))
+            if not batch_user_ids:
+                break
+            users_processed += len(batch_user_ids)
             
-            for movie in top_movies:
-                recommendation, created = Recommendation.objects.get_or_create(
-                    user=user,
-                    movie_tvshow=movie,
-                    defaults={
-                        'reason_code': 'admin_generated'
-                    }
+            rated_pairs = set(Rating.objects.filter(
+                user_id__in=batch_user_ids, movie_tvshow_id__in=candidate_ids
+            ).values_list('user_id', 'movie_tvshow_id'))
+            recommended_pairs = set(Recommendation.objects.filter(
+                user_id__in=batch_user_ids, movie_tvshow_id__in=candidate_ids
+            ).values_list('user_id', 'movie_tvshow_id'))
+            
+            new_recommendations = []
+            for user_id in batch_user_ids:
+                # Топ-3 фильма, которые пользователь еще не оценивал
+                top_movie_ids = [
+                    movie_id for movie_id in candidate_ids
+                    if (user_id, movie_id) not in rated_pairs
+                ][:3]
+                new_recommendations.extend(
+                    Recommendation(user_id=user_id, movie_tvshow_id=movie_id, reason_code='admin_generated')
+                    for movie_id in top_movie_ids
+                    if (user_id, movie_id) not in recommended_pairs
                 )
-                if created:
-                    recommendations_created += 1
+            Recommendation.objects.bulk_create(new_recommendations, ignore_conflicts=True)
+            recommendations_created += len(new_recommendations)
         
         return JsonResponse({
             'success': True,
             'message': f'Создано {recommendations_created} новых рекомендаций',
             'recommendations_created': recommendations_created,
-            'users_processed': users.count()
+            'users_processed': users_processed
         })
         
     except Exception as e:
@@ -426,6 +533,7 @@ def generate_recommendations_api(request: HttpRequest) -> JsonResponse:
 
 @csrf_exempt
 @require_http_methods(["POST"])
+@admin_api_required
 def moderate_review_api(request: HttpRequest, review_id: int) -> JsonResponse:
     """
     API для модерации отзывов администратором.
@@ -437,18 +545,6 @@ def moderate_review_api(request: HttpRequest, review_id: int) -> JsonResponse:
         JsonResponse: Результат модерации
     """
     try:
-        if not request.user.is_authenticated:
-            return JsonResponse({
-                'success': False,
-                'error': 'Необходима авторизация'
-            }, status=401)
-        
-        if not (request.user.is_staff or request.user.is_superuser):
-            return JsonResponse({
-                'success': False,
-                'error': 'Доступ запрещен. Требуются права администратора.'
-            }, status=403)
-        
         try:
             review = Review.objects.get(id=review_id)
         except Review.DoesNotExist:
@@ -501,48 +597,53 @@ def moderate_review_api(request: HttpRequest, review_id: int) -> JsonResponse:
 
 @csrf_exempt
 @require_http_methods(["GET"])
+@admin_api_required
 def pending_reviews_api(request: HttpRequest) -> JsonResponse:
     """
     API для получения отзывов на модерации.
-    Возвращает список отзывов со статусом 'pending'.
+    Возвращает страницу отзывов со статусом 'pending' (параметры cursor и limit);
+    поле count содержит количество отзывов на странице, курсор следующей
+    страницы приходит в поле next_cursor.
     Args:
         request: HttpRequest
     Returns:
         JsonResponse: Список отзывов на модерации
     """
     try:
-        if not request.user.is_authenticated:
-            return JsonResponse({
-                'success': False,
-                'error': 'Необходима авторизация'
-            }, status=401)
-        
-        if not (request.user.is_staff or request.user.is_superuser):
+        # Получаем отзывы на модерации: только отображаемые столбцы,
+        # без создания объектов моделей
+        try:
+            pending_reviews, next_cursor = paginate_by_created_at(
+                Review.objects.filter(moderation_status='pending').values(
+                    'id', 'user__username', 'movie_tvshow__title', 'review_text',
+                    'created_at', 'moderation_status'
+                ),
+                request.GET.get('cursor'),
+                get_page_size(request)
+            )
+        except ValueError as e:
             return JsonResponse({
                 'success': False,
-                'error': 'Доступ запрещен. Требуются права администратора.'
-            }, status=403)
-        
-        # Получаем отзывы на модерации
-        pending_reviews = Review.objects.filter(
-            moderation_status='pending'
-        ).select_related('user', 'movie_tvshow').order_by('-created_at')
+                'error': str(e)
+            }, status=400)
         
-        reviews_data = []
-        for review in pending_reviews:
-            reviews_data.append({
-                'id': review.id,
-                'user': review.user.username,
-                'movie': review.movie_tvshow.title,
-                'text': review.review_text,
-                'created_at': review.created_at.isoformat(),
-                'status': review.moderation_status
-            })
+        reviews_data = [
+            {
+                'id': review['id'],
+                'user': review['user__username'],
+                'movie': review['movie_tvshow__title'],
+                'text': review['review_text'],
+                'created_at': review['created_at'].isoformat(),
+                'status': review['moderation_status']
+            }
+            for review in pending_reviews
+        ]
         
         return JsonResponse({
             'success': True,
             'pending_reviews': reviews_data,
-            'count': len(reviews_data)
+            'count': len(reviews_data),
+            'next_cursor': next_cursor
         })
         
     except Exception as e:
@@ -1,8 +1,17 @@
-from datetime import timedelta, timezone
+from datetime import timedelta
 import django_filters
-from django.db.models import Q, QuerySet, Avg, Count
+from django.db.models import Q, QuerySet, Count, Exists, OuterRef
+from django.db.models.lookups import GreaterThanOrEqual
+from django.utils import timezone
+from django.contrib.postgres.search import SearchQuery, TrigramWordSimilarity
+from rest_framework import filters
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
 from typing import Any, Optional
-from .models import MovieTVShow, Review, Rating, Genre, ActorDirector, MovieTVShowActorDirector
+from .models import (
+    MovieTVShow, Review, Rating, Genre, ActorDirector, MovieTVShowActorDirector,
+    GenreMovieCount, ActorDirectorMovieCount
+)
 
 class MovieTVShowFilter(django_filters.FilterSet):
     """
@@ -16,16 +25,17 @@ class MovieTVShowFilter(django_filters.FilterSet):
     - Участники (актеры, режиссеры)
     - Продолжительность
     """
+    search = django_filters.CharFilter(label='Поиск по названию и описанию', method='filter_search')
     title = django_filters.CharFilter(label='Название содержит', lookup_expr='icontains')
     description = django_filters.CharFilter(label='Описание содержит', lookup_expr='icontains')
-    genres = django_filters.CharFilter(label='Жанры Название содержит', field_name='genres__name', lookup_expr='icontains')
+    genres = django_filters.CharFilter(label='Жанры Название содержит', method='filter_genres')
     country = django_filters.CharFilter(label='Страна содержит', lookup_expr='icontains')
     year = django_filters.NumberFilter(label='Год выпуска', field_name='release_date__year')
     min_rating = django_filters.NumberFilter(label='Минимальный рейтинг', method='filter_min_rating')
     type = django_filters.ChoiceFilter(label='Тип', choices=MovieTVShow.TYPE_CHOICES)
     status = django_filters.ChoiceFilter(label='Статус', choices=MovieTVShow.STATUS_CHOICES)
-    director = django_filters.CharFilter(label='Режиссер содержит', field_name='director__full_name', lookup_expr='icontains')
-    actors = django_filters.CharFilter(label='Актеры содержат', field_name='actors__full_name', lookup_expr='icontains')
+    director = django_filters.CharFilter(label='Режиссер содержит', method='filter_director')
+    actors = django_filters.CharFilter(label='Актеры содержат', method='filter_actors')
     is_new = django_filters.BooleanFilter(label='Новинки', method='filter_is_new')
     has_reviews = django_filters.BooleanFilter(label='Есть отзывы', method='filter_has_reviews')
     min_reviews = django_filters.NumberFilter(label='Минимум отзывов', method='filter_min_reviews')
@@ -35,10 +45,77 @@ class MovieTVShowFilter(django_filters.FilterSet):
     class Meta:
         model = MovieTVShow
         fields = [
-            'title', 'description', 'type', 'status', 'genres', 'country', 'year', 'director', 'actors',
+            'search', 'title', 'description', 'type', 'status', 'genres', 'country', 'year', 'director', 'actors',
             'min_rating', 'is_new', 'has_reviews', 'min_reviews', 'min_duration', 'max_duration'
         ]
 
+    def filter_search(self, queryset: QuerySet, name: str, value: str) -> QuerySet:
+        """
+        Полнотекстовый поиск по названию и описанию.
+        Использует поле search_vector с GIN индексом (заполняется триггером).
+        
+        Args:
+            queryset: Исходный queryset
+            name: Имя поля фильтра
+            value: Поисковый запрос
+            
+        Returns:
+            QuerySet: Отфильтрованный queryset
+        """
+        return queryset.filter(search_vector=SearchQuery(value, config='simple'))
+
+    # Фильтры по связям отбирают id через подзапрос IN вместо JOIN,
+    # поэтому строки не дублируются и DISTINCT не нужен
+    def filter_genres(self, queryset: QuerySet, name: str, value: str) -> QuerySet:
+        """
+        Фильтрация по названию жанра.
+        
+        Args:
+            queryset: Исходный queryset
+            name: Имя поля фильтра
+            value: Часть названия жанра
+            
+        Returns:
+            QuerySet: Отфильтрованный queryset
+        """
+        return queryset.filter(pk__in=MovieTVShow.genres.through.objects.filter(
+            genre__name__icontains=value
+        ).values('movietvshow_id'))
+
+    def filter_director(self, queryset: QuerySet, name: str, value: str) -> QuerySet:
+        """
+        Фильтрация по имени режиссера.
+        
+        Args:
+            queryset: Исходный queryset
+            name: Имя поля фильтра
+            value: Часть имени режиссера
+            
+        Returns:
+            QuerySet: Отфильтрованный queryset
+        """
+        return queryset.filter(pk__in=MovieTVShowActorDirector.objects.filter(
+            role='director',
+            actor_director__full_name__icontains=value
+        ).values('movie_tvshow_id'))
+
+    def filter_actors(self, queryset: QuerySet, name: str, value: str) -> QuerySet:
+        """
+        Фильтрация по имени актера.
+        
+        Args:
+            queryset: Исходный queryset
+            name: Имя поля фильтра
+            value: Часть имени актера
+            
+        Returns:
+            QuerySet: Отфильтрованный queryset
+        """
+        return queryset.filter(pk__in=MovieTVShowActorDirector.objects.filter(
+            role='actor',
+            actor_director__full_name__icontains=value
+        ).values('movie_tvshow_id'))
+
     def filter_min_rating(self, queryset: QuerySet, name: str, value: Any) -> QuerySet:
         """
         Фильтрация по минимальному рейтингу.
@@ -51,9 +128,7 @@ class MovieTVShowFilter(django_filters.FilterSet):
         Returns:
             QuerySet: Отфильтрованный queryset
         """
-        return queryset.annotate(
-            avg_rating=Avg('ratings__rating_value')
-        ).filter(avg_rating__gte=value)
+        return queryset.filter(avg_rating__gte=value)
 
     def filter_is_new(self, queryset: QuerySet, name: str, value: bool) -> QuerySet:
         """
@@ -69,7 +144,7 @@ class MovieTVShowFilter(django_filters.FilterSet):
         """
         if value:
             return queryset.filter(
-                release_date__gte=timezone.now() - timedelta(days=30)
+                release_date__gte=timezone.now().date() - timedelta(days=30)
             )
         return queryset
 
@@ -86,8 +161,8 @@ class MovieTVShowFilter(django_filters.FilterSet):
             QuerySet: Отфильтрованный queryset
         """
         if value:
-            return queryset.filter(reviews__isnull=False).distinct()
-        return queryset.filter(reviews__isnull=True).distinct()
+            return queryset.filter(reviews_count__gt=0)
+        return queryset.filter(reviews_count=0)
 
     def filter_min_reviews(self, queryset: QuerySet, name: str, value: int) -> QuerySet:
         """
@@ -101,9 +176,7 @@ class MovieTVShowFilter(django_filters.FilterSet):
         Returns:
             QuerySet: Отфильтрованный queryset
         """
-        return queryset.annotate(
-            review_count=Count('reviews')
-        ).filter(review_count__gte=value)
+        return queryset.filter(reviews_count__gte=value)
 
 class ReviewFilter(django_filters.FilterSet):
     """
@@ -143,9 +216,11 @@ class ReviewFilter(django_filters.FilterSet):
         Returns:
             QuerySet: Отфильтрованный queryset
         """
-        return queryset.annotate(
-            likes_count=Count('votes', filter=Q(votes__vote_type='like'))
-        ).filter(likes_count__gte=value)
+        # alias() оставляет агрегат только в HAVING, не добавляя его в SELECT
+        # (имя likes_count занято полем модели)
+        return queryset.alias(
+            likes_total=Count('votes', filter=Q(votes__vote_type='like'))
+        ).filter(likes_total__gte=value)
 
 class RatingFilter(django_filters.FilterSet):
     """
@@ -182,9 +257,12 @@ class RatingFilter(django_filters.FilterSet):
         Returns:
             QuerySet: Отфильтрованный queryset
         """
-        if value:
-            return queryset.filter(review__isnull=False)
-        return queryset.filter(review__isnull=True)
+        # Отзыв связан с оценкой через того же пользователя и фильм
+        has_review = Exists(Review.objects.filter(
+            user=OuterRef('user'),
+            movie_tvshow=OuterRef('movie_tvshow')
+        ))
+        return queryset.filter(has_review if value else ~has_review)
 
 class GenreFilter(django_filters.FilterSet):
     """
@@ -201,8 +279,8 @@ class GenreFilter(django_filters.FilterSet):
     has_movies = django_filters.BooleanFilter(label='Есть фильмы', method='filter_has_movies')
     movie_type = django_filters.ChoiceFilter(
         label='Тип контента',
-        field_name='movies__type',
-        choices=MovieTVShow.TYPE_CHOICES
+        choices=MovieTVShow.TYPE_CHOICES,
+        method='filter_movie_type'
     )
 
     class Meta:
@@ -221,9 +299,23 @@ class GenreFilter(django_filters.FilterSet):
         Returns:
             QuerySet: Отфильтрованный queryset
         """
-        return queryset.annotate(
-            movies_count=Count('movies')
-        ).filter(movies_count__gte=value)
+        return queryset.filter(GreaterThanOrEqual(GenreMovieCount.subquery(), value))
+
+    def filter_movie_type(self, queryset: QuerySet, name: str, value: str) -> QuerySet:
+        """
+        Фильтрация жанров по типу контента их фильмов.
+        
+        Args:
+            queryset: Исходный queryset
+            name: Имя поля фильтра
+            value: Тип контента
+            
+        Returns:
+            QuerySet: Отфильтрованный queryset
+        """
+        return queryset.filter(pk__in=MovieTVShow.genres.through.objects.filter(
+            movietvshow__type=value
+        ).values('genre_id'))
 
     def filter_has_movies(self, queryset: QuerySet, name: str, value: bool) -> QuerySet:
         """
@@ -237,9 +329,8 @@ class GenreFilter(django_filters.FilterSet):
         Returns:
             QuerySet: Отфильтрованный queryset
         """
-        if value:
-            return queryset.filter(movies__isnull=False).distinct()
-        return queryset.filter(movies__isnull=True).distinct()
+        has_movies = Exists(MovieTVShow.genres.through.objects.filter(genre=OuterRef('pk')))
+        return queryset.filter(has_movies if value else ~has_movies)
 
 class ActorDirectorFilter(django_filters.FilterSet):
     """
@@ -254,17 +345,20 @@ class ActorDirectorFilter(django_filters.FilterSet):
     - Специфическим ролям (только актеры/только режиссеры)
     """
     name = django_filters.CharFilter(label='Имя содержит', field_name='full_name', lookup_expr='icontains')
-    role = django_filters.ChoiceFilter(label='Роль в фильме', choices=MovieTVShowActorDirector.ROLE_CHOICES)
+    role = django_filters.ChoiceFilter(
+        label='Роль в фильме',
+        choices=MovieTVShowActorDirector.ROLE_CHOICES,
+        method='filter_role'
+    )
     min_movies = django_filters.NumberFilter(label='Минимум фильмов', method='filter_min_movies')
     movie_type = django_filters.ChoiceFilter(
         label='Тип контента',
-        field_name='movies__type',
-        choices=MovieTVShow.TYPE_CHOICES
+        choices=MovieTVShow.TYPE_CHOICES,
+        method='filter_movie_type'
     )
     movie_genre = django_filters.CharFilter(
         label='Жанр фильма содержит',
-        field_name='movies__genres__name',
-        lookup_expr='icontains'
+        method='filter_movie_genre'
     )
     is_actor = django_filters.BooleanFilter(label='Является актером', method='filter_is_actor')
     is_director = django_filters.BooleanFilter(label='Является режиссером', method='filter_is_director')
@@ -285,9 +379,59 @@ class ActorDirectorFilter(django_filters.FilterSet):
         Returns:
             QuerySet: Отфильтрованный queryset
         """
-        return queryset.annotate(
-            movies_count=Count('movies')
-        ).filter(movies_count__gte=value)
+        return queryset.filter(GreaterThanOrEqual(ActorDirectorMovieCount.subquery(), value))
+
+    def filter_movie_type(self, queryset: QuerySet, name: str, value: str) -> QuerySet:
+        """
+        Фильтрация по типу контента фильмов актера/режиссера.
+        
+        Args:
+            queryset: Исходный queryset
+            name: Имя поля фильтра
+            value: Тип контента
+            
+        Returns:
+            QuerySet: Отфильтрованный queryset
+        """
+        return queryset.filter(pk__in=MovieTVShowActorDirector.objects.filter(
+            movie_tvshow__type=value
+        ).values('actor_director_id'))
+
+    def filter_movie_genre(self, queryset: QuerySet, name: str, value: str) -> QuerySet:
+        """
+        Фильтрация по жанру фильмов актера/режиссера.
+        
+        Args:
+            queryset: Исходный queryset
+            name: Имя поля фильтра
+            value: Часть названия жанра
+            
+        Returns:
+            QuerySet: Отфильтрованный queryset
+        """
+        return queryset.filter(pk__in=MovieTVShowActorDirector.objects.filter(
+            movie_tvshow__genres__name__icontains=value
+        ).values('actor_director_id'))
+
+    def filter_role(self, queryset: QuerySet, name: str, value: str, present: bool = True) -> QuerySet:
+        """
+        Фильтрация по роли в фильмах.
+        Роль хранится в связях с фильмами, поэтому проверяется через EXISTS.
+        
+        Args:
+            queryset: Исходный queryset
+            name: Имя поля фильтра
+            value: Роль (актер/режиссер)
+            present: True для имеющих роль, False для не имеющих
+            
+        Returns:
+            QuerySet: Отфильтрованный queryset
+        """
+        has_role = Exists(MovieTVShowActorDirector.objects.filter(
+            actor_director=OuterRef('pk'),
+            role=value
+        ))
+        return queryset.filter(has_role if present else ~has_role)
 
     def filter_is_actor(self, queryset: QuerySet, name: str, value: bool) -> QuerySet:
         """
@@ -301,9 +445,7 @@ class ActorDirectorFilter(django_filters.FilterSet):
         Returns:
             QuerySet: Отфильтрованный queryset
         """
-        if value:
-            return queryset.filter(role='actor')
-        return queryset.exclude(role='actor')
+        return self.filter_role(queryset, name, 'actor', present=value)
 
     def filter_is_director(self, queryset: QuerySet, name: str, value: bool) -> QuerySet:
         """
@@ -317,6 +459,53 @@ class ActorDirectorFilter(django_filters.FilterSet):
         Returns:
             QuerySet: Отфильтрованный queryset
         """
-        if value:
-            return queryset.filter(role='director')
-        return queryset.exclude(role='director') 
\ No newline at end of file
+        return self.filter_role(queryset, name, 'director', present=value)
+
+
+class TrigramSearchFilter(filters.SearchFilter):
+    """
+    Поиск по триграммам PostgreSQL вместо ILIKE '%q%'.
+    
+    Условие `%>` (trigram_word_similar) обслуживается GIN индексами gin_trgm_ops,
+    поэтому поиск не требует полного сканирования таблицы. Результаты упорядочены
+    по релевантности, если порядок не задан явно параметром ordering.
+    
+    В отличие от ILIKE, совпадение ищется по словам: запрос находит слова,
+    похожие на него (в том числе с опечатками), но не фрагменты внутри слов.
+    Запросы короче MIN_TRIGRAM_QUERY_LENGTH символов не дают триграмм для
+    сравнения и обрабатываются стандартным поиском подстроки SearchFilter.
+    """
+    MIN_TRIGRAM_QUERY_LENGTH = 3
+
+    def filter_queryset(self, request: Request, queryset: QuerySet, view: Any) -> QuerySet:
+        """
+        Фильтрация и ранжирование по сходству с поисковым запросом.
+        
+        Args:
+            request: Запрос DRF
+            queryset: Исходный queryset
+            view: Представление
+            
+        Returns:
+            QuerySet: Отфильтрованный queryset
+        """
+        search_fields = self.get_search_fields(view, request)
+        search_terms = self.get_search_terms(request)
+        if not search_fields or not search_terms:
+            return queryset
+
+        query = ' '.join(search_terms)
+        if len(query) < self.MIN_TRIGRAM_QUERY_LENGTH:
+            return super().filter_queryset(request, queryset, view)
+
+        condition = Q()
+        similarity = None
+        for field in search_fields:
+            condition |= Q(**{f'{field}__trigram_word_similar': query})
+            field_similarity = TrigramWordSimilarity(query, field)
+            similarity = field_similarity if similarity is None else similarity + field_similarity
+
+        queryset = queryset.filter(condition).annotate(search_similarity=similarity)
+        if request.query_params.get(api_settings.ORDERING_PARAM):
+            return queryset
+        return queryset.order_by('-search_similarity')
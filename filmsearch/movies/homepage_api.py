@@ -5,10 +5,13 @@ from django.db.models import Avg, Count, Q
 from django.utils import timezone
 from datetime import timedelta
 from typing import Any, Dict, List, Optional
+from django.views.decorators.http import condition
 from .models import MovieTVShow, Genre, Review
 from .serializers import MovieTVShowSerializer, GenreSerializer
+from .api_views import catalog_etag
 
 
+@condition(etag_func=catalog_etag)
 @api_view(['GET'])
 def homepage_data(request: Request) -> Response:
     """
@@ -26,11 +29,8 @@ def homepage_data(request: Request) -> Response:
         Response: JSON с данными для главной страницы
     """
     
-    # 1. Топ фильмов по рейтингу (черещ AVG)
-    top_movies = MovieTVShow.objects.annotate(
-        avg_rating=Avg('ratings__rating_value'),
-        ratings_count=Count('ratings')
-    ).filter(ratings_count__gt=0).order_by('-avg_rating')[:8]
+    # 1. Топ фильмов по рейтингу (по сохраненной средней оценке)
+    top_movies = MovieTVShow.objects.filter(ratings_count__gt=0).order_by('-avg_rating')[:8]
     
     # 2. Популярные жанры (через COUNT)
     popular_genres = Genre.objects.annotate(
@@ -189,10 +189,6 @@ def movie_detail_api(request: Request, movie_id: int) -> Response:
     try:
         movie = MovieTVShow.objects.get(id=movie_id)
         
-        # Получаем рейтинг
-        avg_rating = movie.ratings.aggregate(avg=Avg('rating_value'))['avg']
-        ratings_count = movie.ratings.count()
-        
         # Получаем отзывы
         reviews = movie.reviews.filter(moderation_status='approved').order_by('-created_at')[:5]
         reviews_data: List[Dict[str, Any]] = []
@@ -221,11 +217,11 @@ def movie_detail_api(request: Request, movie_id: int) -> Response:
             'country': movie.country,
             'status': movie.status,
             'age_restriction': movie.age_restriction,
-            'avg_rating': round(avg_rating, 1) if avg_rating else None,
-            'ratings_count': ratings_count,
+            'avg_rating': round(movie.avg_rating, 1) if movie.avg_rating else None,
+            'ratings_count': movie.ratings_count,
             'genres': [{'id': g.id, 'name': g.name} for g in movie.genres.all()],
             'reviews': reviews_data,
-            'reviews_count': movie.reviews.count()
+            'reviews_count': movie.reviews_count
         }
         
         return Response(movie_data)
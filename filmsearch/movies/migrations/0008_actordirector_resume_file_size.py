@@ -0,0 +1,29 @@
+# Generated by Django 4.2.7 on 2026-10-16 12:00
+
+from django.db import migrations, models
+
+
+def fill_resume_file_size(apps, schema_editor):
+    ActorDirector = apps.get_model('movies', 'ActorDirector')
+    for actor in ActorDirector.objects.exclude(resume_file='').exclude(resume_file__isnull=True):
+        try:
+            actor.resume_file_size = actor.resume_file.size
+        except (OSError, ValueError):
+            continue
+        actor.save(update_fields=['resume_file_size'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0007_actordirector_photo_image_actordirector_resume_file_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='actordirector',
+            name='resume_file_size',
+            field=models.PositiveBigIntegerField(blank=True, editable=False, null=True, verbose_name='Размер файла резюме (байт)'),
+        ),
+        migrations.RunPython(fill_resume_file_size, migrations.RunPython.noop),
+    ]
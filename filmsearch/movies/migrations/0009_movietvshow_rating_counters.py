@@ -0,0 +1,44 @@
+# Generated by Django 4.2.7 on 2026-10-16 12:00
+
+from django.db import migrations, models
+from django.db.models import Avg, Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def fill_rating_counters(apps, schema_editor):
+    MovieTVShow = apps.get_model('movies', 'MovieTVShow')
+    Rating = apps.get_model('movies', 'Rating')
+    Review = apps.get_model('movies', 'Review')
+    ratings = Rating.objects.filter(movie_tvshow=OuterRef('pk')).values('movie_tvshow')
+    reviews = Review.objects.filter(movie_tvshow=OuterRef('pk')).values('movie_tvshow')
+    MovieTVShow.objects.update(
+        avg_rating=Coalesce(Subquery(ratings.annotate(value=Avg('rating_value')).values('value')), Value(0.0)),
+        ratings_count=Coalesce(Subquery(ratings.annotate(value=Count('*')).values('value')), Value(0)),
+        reviews_count=Coalesce(Subquery(reviews.annotate(value=Count('*')).values('value')), Value(0))
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0008_actordirector_resume_file_size'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='movietvshow',
+            name='avg_rating',
+            field=models.FloatField(db_index=True, default=0, editable=False, verbose_name='Средняя оценка'),
+        ),
+        migrations.AddField(
+            model_name='movietvshow',
+            name='ratings_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Количество оценок'),
+        ),
+        migrations.AddField(
+            model_name='movietvshow',
+            name='reviews_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Количество отзывов'),
+        ),
+        migrations.RunPython(fill_rating_counters, migrations.RunPython.noop),
+    ]
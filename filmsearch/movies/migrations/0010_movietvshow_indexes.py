@@ -0,0 +1,28 @@
+# Generated by Django 4.2.7 on 2026-10-16 12:00
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0009_movietvshow_rating_counters'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name='movietvshow',
+            index=models.Index(fields=['-release_date'], name='movie_release_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='movietvshow',
+            index=models.Index(fields=['type', 'release_date'], name='movie_type_release_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='movietvshow',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['title'], name='movie_title_trgm', opclasses=['gin_trgm_ops']),
+        ),
+    ]
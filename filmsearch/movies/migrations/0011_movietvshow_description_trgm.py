@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-10-16 12:00
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0010_movietvshow_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='movietvshow',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['description'], name='movie_description_trgm', opclasses=['gin_trgm_ops']),
+        ),
+    ]
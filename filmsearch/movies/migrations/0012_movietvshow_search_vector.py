@@ -0,0 +1,53 @@
+# Generated by Django 4.2.7 on 2026-10-16 12:00
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+# search_vector пересчитывается триггером при вставке и изменении названия/описания,
+# поэтому значение, которое передает Django, всегда перезаписывается
+SEARCH_VECTOR_TRIGGER_SQL = """
+CREATE FUNCTION movies_movietvshow_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector := to_tsvector('simple', coalesce(NEW.title, '') || ' ' || coalesce(NEW.description, ''));
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER movies_movietvshow_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF title, description, search_vector ON movies_movietvshow
+    FOR EACH ROW EXECUTE FUNCTION movies_movietvshow_search_vector_update();
+
+UPDATE movies_movietvshow
+    SET search_vector = to_tsvector('simple', coalesce(title, '') || ' ' || coalesce(description, ''));
+"""
+
+DROP_SEARCH_VECTOR_TRIGGER_SQL = """
+DROP TRIGGER IF EXISTS movies_movietvshow_search_vector_trigger ON movies_movietvshow;
+DROP FUNCTION IF EXISTS movies_movietvshow_search_vector_update();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0011_movietvshow_description_trgm'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='movietvshow',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='movietvshow',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='movie_search_vector_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='actordirector',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['full_name'], name='actor_full_name_trgm', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.RunSQL(SEARCH_VECTOR_TRIGGER_SQL, DROP_SEARCH_VECTOR_TRIGGER_SQL),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 4.2.7 on 2026-10-16 12:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+# Уникальные индексы нужны для REFRESH MATERIALIZED VIEW CONCURRENTLY
+CREATE_VIEWS_SQL = """
+CREATE MATERIALIZED VIEW movies_genre_movie_counts AS
+    SELECT genre_id, COUNT(*) AS movies_count
+    FROM movies_movietvshow_genres
+    GROUP BY genre_id;
+CREATE UNIQUE INDEX movies_genre_movie_counts_genre_id ON movies_genre_movie_counts (genre_id);
+
+CREATE MATERIALIZED VIEW movies_actordirector_movie_counts AS
+    SELECT actor_director_id, COUNT(*) AS movies_count
+    FROM movies_movietvshowactordirector
+    GROUP BY actor_director_id;
+CREATE UNIQUE INDEX movies_actordirector_movie_counts_actor_director_id
+    ON movies_actordirector_movie_counts (actor_director_id);
+"""
+
+DROP_VIEWS_SQL = """
+DROP MATERIALIZED VIEW IF EXISTS movies_actordirector_movie_counts;
+DROP MATERIALIZED VIEW IF EXISTS movies_genre_movie_counts;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0013_actordirector_biography_trgm'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GenreMovieCount',
+            fields=[
+                ('genre', models.OneToOneField(on_delete=django.db.models.deletion.DO_NOTHING, primary_key=True, related_name='+', serialize=False, to='movies.genre')),
+                ('movies_count', models.IntegerField(verbose_name='Количество фильмов')),
+            ],
+            options={
+                'db_table': 'movies_genre_movie_counts',
+                'managed': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='ActorDirectorMovieCount',
+            fields=[
+                ('actor_director', models.OneToOneField(on_delete=django.db.models.deletion.DO_NOTHING, primary_key=True, related_name='+', serialize=False, to='movies.actordirector')),
+                ('movies_count', models.IntegerField(verbose_name='Количество фильмов')),
+            ],
+            options={
+                'db_table': 'movies_actordirector_movie_counts',
+                'managed': False,
+            },
+        ),
+        migrations.RunSQL(CREATE_VIEWS_SQL, DROP_VIEWS_SQL),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-16 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0014_movie_count_materialized_views'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='movietvshow',
+            index=models.Index(fields=['-created_at', '-id'], name='movie_created_at_id_idx'),
+        ),
+    ]
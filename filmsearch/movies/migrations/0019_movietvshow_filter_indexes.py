@@ -0,0 +1,21 @@
+# Generated by Django 4.2.7 on 2026-10-16 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0018_keyset_pagination_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='movietvshow',
+            index=models.Index(fields=['type', 'status', '-release_date'], name='movie_type_status_release_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='movietvshow',
+            index=models.Index(fields=['duration'], name='movie_duration_idx'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 4.2.7 on 2026-10-16 12:00
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0019_movietvshow_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='actordirector',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('full_name'), name='gin_trgm_ops'), name='actor_full_name_upper_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='movietvshow',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('title'), name='gin_trgm_ops'), name='movie_title_upper_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='movietvshow',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('description'), name='gin_trgm_ops'), name='movie_description_upper_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='movietvshow',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('country'), name='gin_trgm_ops'), name='movie_country_upper_trgm'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-16 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0020_upper_trgm_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='movietvshowactordirector',
+            index=models.Index(fields=['actor_director', 'role'], name='credit_person_role_idx'),
+        ),
+    ]
@@ -1,12 +1,15 @@
-from django.db import models
+from django.db import connection, models
+from django.db.models.functions import Upper
 from django.contrib.auth.models import User
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVectorField
 from django.utils.translation import gettext_lazy as _
 from django.core.exceptions import ValidationError
 from django.utils import timezone
 from datetime import timedelta, date
 import datetime
 from django.urls import reverse
-from typing import Optional, Union
+from typing import Dict, Optional, Union
 
 
 class Genre(models.Model):
@@ -51,11 +54,25 @@ class ActorDirector(models.Model):
         null=True,
         help_text=_('Загрузите файл с подробной биографией')
     )
+    resume_file_size = models.PositiveBigIntegerField(
+        _('Размер файла резюме (байт)'),
+        null=True,
+        blank=True,
+        editable=False
+    )
 
     class Meta:
         verbose_name = _('Актер/Режиссер')
         verbose_name_plural = _('Актеры/Режиссеры')
         ordering = ['full_name']
+        indexes = [
+            # триграммные индексы для поиска по имени и биографии
+            GinIndex(fields=['full_name'], name='actor_full_name_trgm', opclasses=['gin_trgm_ops']),
+            GinIndex(fields=['biography'], name='actor_biography_trgm', opclasses=['gin_trgm_ops']),
+            # icontains в PostgreSQL сравнивает UPPER(столбец), поэтому фильтрам
+            # нужны триграммные индексы по выражению
+            GinIndex(OpClass(Upper('full_name'), name='gin_trgm_ops'), name='actor_full_name_upper_trgm'),
+        ]
 
     def __str__(self) -> str:
         """
@@ -101,6 +118,33 @@ class ActorDirector(models.Model):
             str: URL страницы актера/режиссера
         """
         return reverse('actor_director_detail', kwargs={'pk': self.pk})
+    
+    def get_resume_file_size(self) -> Optional[int]:
+        """
+        Размер файла резюме без обращения к хранилищу, если он сохранен в БД.
+        Returns:
+            Optional[int]: Размер файла в байтах или None, если файла нет
+        """
+        if not self.resume_file:
+            return None
+        if self.resume_file_size is None:
+            try:
+                return self.resume_file.size
+            except (OSError, ValueError):
+                return None
+        return self.resume_file_size
+    
+    def save(self, *args, **kwargs) -> None:
+        """
+        Переопределяем save для сохранения размера файла резюме.
+        """
+        self.resume_file_size = None
+        if self.resume_file:
+            try:
+                self.resume_file_size = self.resume_file.size
+            except (OSError, ValueError):
+                pass
+        super().save(*args, **kwargs)
 
 
 class MovieTVShowManager(models.Manager):
@@ -148,11 +192,7 @@ class MovieTVShowManager(models.Manager):
         Returns:
             QuerySet: QuerySet с топ фильмами/сериалами по рейтингу
         """
-        from django.db.models import Avg, Count
-        return self.annotate(
-            avg_rating=Avg('ratings__rating_value'),
-            ratings_count=Count('ratings')
-        ).filter(ratings_count__gt=0).order_by('-avg_rating')[:limit]
+        return self.filter(ratings_count__gt=0).order_by('-avg_rating')[:limit]
     
     def most_reviewed(self, limit: int = 10):
         """
@@ -162,10 +202,51 @@ class MovieTVShowManager(models.Manager):
         Returns:
             QuerySet: QuerySet с самыми обсуждаемыми фильмами/сериалами
         """
-        from django.db.models import Count
-        return self.annotate(
-            reviews_count=Count('reviews')
-        ).order_by('-reviews_count')[:limit]
+        return self.order_by('-reviews_count')[:limit]
+    
+    def refresh_counters(self, movie_ids):
+        """
+        Пересчитывает денормализованную статистику оценок и отзывов.
+        Args:
+            movie_ids: Идентификаторы фильмов/сериалов для пересчета
+        Returns:
+            int: Количество обновленных фильмов/сериалов
+        """
+        from django.db.models import Avg, Count, OuterRef, Subquery, Value
+        from django.db.models.functions import Coalesce
+        ratings = Rating.objects.filter(movie_tvshow=OuterRef('pk')).values('movie_tvshow')
+        reviews = Review.objects.filter(movie_tvshow=OuterRef('pk')).values('movie_tvshow')
+        return self.filter(pk__in=movie_ids).update(
+            avg_rating=Coalesce(Subquery(ratings.annotate(value=Avg('rating_value')).values('value')), Value(0.0)),
+            ratings_count=Coalesce(Subquery(ratings.annotate(value=Count('*')).values('value')), Value(0)),
+            reviews_count=Coalesce(Subquery(reviews.annotate(value=Count('*')).values('value')), Value(0))
+        )
+    
+    def catalog_counts(self, **querysets: models.QuerySet) -> Dict[str, int]:
+        """
+        Общая статистика каталога одним запросом к БД: количество фильмов,
+        сериалов и жанров и количество строк дополнительных querysets.
+        Каждый queryset строится через ORM и подставляется скалярным
+        подзапросом SELECT COUNT(*).
+        Args:
+            **querysets: Дополнительные счетчики (имя -> queryset)
+        Returns:
+            Dict[str, int]: total_movies, total_tv_shows, total_genres и дополнительные счетчики
+        """
+        querysets = {
+            'total_movies': self.filter(type='movie'),
+            'total_tv_shows': self.filter(type='tv_show'),
+            'total_genres': Genre.objects.all(),
+            **querysets,
+        }
+        selects, params = [], []
+        for queryset in querysets.values():
+            sql, queryset_params = queryset.order_by().values('pk').query.sql_with_params()
+            selects.append(f'(SELECT COUNT(*) FROM ({sql}) AS counted)')
+            params.extend(queryset_params)
+        with connection.cursor() as cursor:
+            cursor.execute(f'SELECT {", ".join(selects)}', params)
+            return dict(zip(querysets, cursor.fetchone()))
     
     def by_genre(self, genre_name: str):
         """
@@ -240,6 +321,14 @@ class MovieTVShow(models.Model):
     created_at = models.DateTimeField(_('Дата создания'), auto_now_add=True)
     updated_at = models.DateTimeField(_('Дата обновления'), auto_now=True)
     
+    # Денормализованная статистика, пересчитывается при изменении оценок и отзывов
+    avg_rating = models.FloatField(_('Средняя оценка'), default=0, db_index=True, editable=False)
+    ratings_count = models.PositiveIntegerField(_('Количество оценок'), default=0, editable=False)
+    reviews_count = models.PositiveIntegerField(_('Количество отзывов'), default=0, editable=False)
+    
+    # Полнотекстовый индекс по названию и описанию, заполняется триггером БД
+    search_vector = SearchVectorField(null=True, editable=False)
+    
     genres = models.ManyToManyField(Genre, verbose_name=_('Жанры'), related_name='movies')
     actors_directors = models.ManyToManyField(
         ActorDirector, 
@@ -255,6 +344,23 @@ class MovieTVShow(models.Model):
         verbose_name = _('Фильм/Сериал')
         verbose_name_plural = _('Фильмы/Сериалы')
         ordering = ['-release_date']
+        indexes = [
+            models.Index(fields=['-release_date'], name='movie_release_date_idx'),
+            models.Index(fields=['type', 'release_date'], name='movie_type_release_date_idx'),
+            # keyset-пагинация расширенного поиска
+            models.Index(fields=['-created_at', '-id'], name='movie_created_at_id_idx'),
+            # фильтры каталога по типу и статусу с сортировкой по умолчанию
+            models.Index(fields=['type', 'status', '-release_date'], name='movie_type_status_release_idx'),
+            models.Index(fields=['duration'], name='movie_duration_idx'),
+            # триграммные индексы для поиска по названию и описанию
+            GinIndex(fields=['title'], name='movie_title_trgm', opclasses=['gin_trgm_ops']),
+            GinIndex(fields=['description'], name='movie_description_trgm', opclasses=['gin_trgm_ops']),
+            GinIndex(fields=['search_vector'], name='movie_search_vector_idx'),
+            # индексы по UPPER() для фильтров icontains
+            GinIndex(OpClass(Upper('title'), name='gin_trgm_ops'), name='movie_title_upper_trgm'),
+            GinIndex(OpClass(Upper('description'), name='gin_trgm_ops'), name='movie_description_upper_trgm'),
+            GinIndex(OpClass(Upper('country'), name='gin_trgm_ops'), name='movie_country_upper_trgm'),
+        ]
 
     def __str__(self) -> str:
         """
@@ -404,6 +510,10 @@ class MovieTVShowActorDirector(models.Model):
         verbose_name = _('Роль в фильме/сериале')
         verbose_name_plural = _('Роли в фильмах/сериалах')
         unique_together = ('movie_tvshow', 'actor_director', 'role')
+        indexes = [
+            # проверка роли актера/режиссера (фильтры is_actor, is_director, role)
+            models.Index(fields=['actor_director', 'role'], name='credit_person_role_idx'),
+        ]
 
     def __str__(self) -> str:
         """
@@ -414,6 +524,88 @@ class MovieTVShowActorDirector(models.Model):
         return f"{self.actor_director} - {self.get_role_display()} в {self.movie_tvshow}"
 
 
+class GenreMovieCount(models.Model):
+    """
+    Количество фильмов/сериалов в жанре.
+    Только для чтения: материализованное представление, обновляется сигналами.
+    """
+    genre = models.OneToOneField(
+        Genre,
+        on_delete=models.DO_NOTHING,
+        primary_key=True,
+        related_name='+'
+    )
+    movies_count = models.IntegerField(_('Количество фильмов'))
+
+    class Meta:
+        managed = False
+        db_table = 'movies_genre_movie_counts'
+
+    @classmethod
+    def subquery(cls):
+        """
+        Выражение для аннотации количества фильмов жанра.
+        Returns:
+            Coalesce: Количество фильмов (0 для жанров без фильмов)
+        """
+        from django.db.models import OuterRef, Subquery, Value
+        from django.db.models.functions import Coalesce
+        return Coalesce(
+            Subquery(cls.objects.filter(genre=OuterRef('pk')).values('movies_count')),
+            Value(0)
+        )
+
+    @classmethod
+    def refresh(cls) -> None:
+        """
+        Обновление материализованного представления.
+        """
+        from django.db import connection
+        with connection.cursor() as cursor:
+            cursor.execute(f'REFRESH MATERIALIZED VIEW CONCURRENTLY {cls._meta.db_table}')
+
+
+class ActorDirectorMovieCount(models.Model):
+    """
+    Количество фильмов/сериалов актера/режиссера.
+    Только для чтения: материализованное представление, обновляется сигналами.
+    """
+    actor_director = models.OneToOneField(
+        ActorDirector,
+        on_delete=models.DO_NOTHING,
+        primary_key=True,
+        related_name='+'
+    )
+    movies_count = models.IntegerField(_('Количество фильмов'))
+
+    class Meta:
+        managed = False
+        db_table = 'movies_actordirector_movie_counts'
+
+    @classmethod
+    def subquery(cls):
+        """
+        Выражение для аннотации количества фильмов актера/режиссера.
+        Returns:
+            Coalesce: Количество фильмов (0 для актеров без фильмов)
+        """
+        from django.db.models import OuterRef, Subquery, Value
+        from django.db.models.functions import Coalesce
+        return Coalesce(
+            Subquery(cls.objects.filter(actor_director=OuterRef('pk')).values('movies_count')),
+            Value(0)
+        )
+
+    @classmethod
+    def refresh(cls) -> None:
+        """
+        Обновление материализованного представления.
+        """
+        from django.db import connection
+        with connection.cursor() as cursor:
+            cursor.execute(f'REFRESH MATERIALIZED VIEW CONCURRENTLY {cls._meta.db_table}')
+
+
 class Collection(models.Model):
     """Модель для хранения подборок пользователей"""
     user = models.ForeignKey(
@@ -444,6 +636,9 @@ class Collection(models.Model):
         verbose_name = _('Подборка')
         verbose_name_plural = _('Подборки')
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='collection_created_at_id_idx'),
+        ]
 
     def __str__(self) -> str:
         """
@@ -652,6 +847,10 @@ class Rating(models.Model):
         verbose_name = _('Оценка')
         verbose_name_plural = _('Оценки')
         unique_together = ('user', 'movie_tvshow')
+        indexes = [
+            # средняя оценка фильма считается только по индексу
+            models.Index(fields=['movie_tvshow', 'rating_value'], name='rating_movie_value_idx'),
+        ]
 
     def __str__(self) -> str:
         """
@@ -720,6 +919,10 @@ class Review(models.Model):
         verbose_name = _('Отзыв')
         verbose_name_plural = _('Отзывы')
         ordering = ['-created_at']
+        indexes = [
+            # очередь модерации: отзывы со статусом, новые первыми
+            models.Index(fields=['moderation_status', '-created_at', '-id'], name='review_moderation_created_idx'),
+        ]
 
     def __str__(self) -> str:
         """
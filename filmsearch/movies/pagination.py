@@ -0,0 +1,88 @@
+"""
+Keyset-пагинация по (created_at, id).
+
+Страница выбирается диапазонным чтением по индексу (created_at DESC, id DESC)
+без OFFSET и без подсчета всех строк. Курсор имеет вид <created_at>_<id>
+и указывает на последнюю запись предыдущей страницы.
+"""
+
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+
+from django.db.models import Q, QuerySet
+
+
+def make_cursor(created_at: datetime, pk: int) -> str:
+    """
+    Курсор, указывающий на позицию после записи.
+
+    Args:
+        created_at: Дата создания записи
+        pk: Идентификатор записи
+
+    Returns:
+        str: Курсор вида <created_at>_<id>
+    """
+    return f'{created_at.isoformat()}_{pk}'
+
+
+def parse_cursor(cursor: str) -> Optional[Tuple[datetime, int]]:
+    """
+    Разбор курсора.
+
+    Args:
+        cursor: Курсор вида <created_at>_<id>
+
+    Returns:
+        Optional[Tuple[datetime, int]]: Дата создания и id или None для некорректного курсора
+    """
+    created_at, _, pk = cursor.rpartition('_')
+    # '+' смещения часового пояса в неэкранированном query string превращается в пробел
+    try:
+        return datetime.fromisoformat(created_at.replace(' ', '+')), int(pk)
+    except ValueError:
+        return None
+
+
+def paginate_by_created_at(
+    queryset: QuerySet,
+    cursor: Optional[str],
+    page_size: int
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    Выборка страницы, следующей за курсором.
+    Работает как с объектами моделей, так и с результатами values()
+    (в values() должны входить 'created_at' и 'id').
+
+    Args:
+        queryset: Исходный queryset
+        cursor: Курсор предыдущей страницы или None для первой страницы
+        page_size: Размер страницы
+
+    Returns:
+        Tuple[List[Any], Optional[str]]: Записи страницы и курсор следующей страницы
+            (None, если страница последняя)
+
+    Raises:
+        ValueError: При некорректном курсоре
+    """
+    if cursor:
+        position = parse_cursor(cursor)
+        if position is None:
+            raise ValueError('Некорректный курсор')
+        cursor_created_at, cursor_id = position
+        queryset = queryset.filter(
+            Q(created_at__lt=cursor_created_at) |
+            Q(created_at=cursor_created_at, id__lt=cursor_id)
+        )
+
+    # Запрашиваем на одну запись больше, чтобы узнать о наличии следующей страницы
+    items = list(queryset.order_by('-created_at', '-id')[:page_size + 1])
+    if len(items) <= page_size:
+        return items, None
+
+    items = items[:page_size]
+    last = items[-1]
+    if isinstance(last, dict):
+        return items, make_cursor(last['created_at'], last['id'])
+    return items, make_cursor(last.created_at, last.pk)
@@ -26,6 +26,8 @@ class GenreSerializer(serializers.ModelSerializer):
         Returns:
             int: Количество фильмов в данном жанре
         """
+        if hasattr(obj, 'movies_count'):
+            return obj.movies_count
         return obj.movies.count()
 
 
@@ -64,6 +66,8 @@ class ActorDirectorSerializer(serializers.ModelSerializer):
         Returns:
             int: Количество фильмов с участием данного актера/режиссера
         """
+        if hasattr(obj, 'movies_count'):
+            return obj.movies_count
         return obj.movies.count()
 
 
@@ -90,6 +94,7 @@ class ReviewSerializer(serializers.ModelSerializer):
     def get_likes_count(self, obj: Review) -> int:
         """
         Точное количество лайков.
+        Используется аннотация vote_likes, если queryset ее содержит.
         
         Args:
             obj: Объект отзыва
@@ -97,11 +102,13 @@ class ReviewSerializer(serializers.ModelSerializer):
         Returns:
             int: Количество лайков отзыва
         """
-        return obj.get_likes_count()
+        likes = getattr(obj, 'vote_likes', None)
+        return obj.get_likes_count() if likes is None else likes
     
     def get_dislikes_count(self, obj: Review) -> int:
         """
         Точное количество дизлайков.
+        Используется аннотация vote_dislikes, если queryset ее содержит.
         
         Args:
             obj: Объект отзыва
@@ -109,7 +116,8 @@ class ReviewSerializer(serializers.ModelSerializer):
         Returns:
             int: Количество дизлайков отзыва
         """
-        return obj.get_dislikes_count()
+        dislikes = getattr(obj, 'vote_dislikes', None)
+        return obj.get_dislikes_count() if dislikes is None else dislikes
     
     def get_rating_percentage(self, obj: Review) -> float:
         """
@@ -121,7 +129,12 @@ class ReviewSerializer(serializers.ModelSerializer):
         Returns:
             float: Рейтинг отзыва в процентах
         """
-        return obj.get_rating()
+        if not hasattr(obj, 'vote_likes'):
+            return obj.get_rating()
+        total = obj.vote_likes + obj.vote_dislikes
+        if total == 0:
+            return 0
+        return (obj.vote_likes / total) * 100
     
     def get_is_fresh(self, obj: Review) -> bool:
         """
@@ -198,7 +211,7 @@ class MovieTVShowSerializer(serializers.ModelSerializer):
         Returns:
             float: Средний рейтинг фильма/сериала
         """
-        return obj.get_average_rating()
+        return obj.avg_rating
     
     def get_reviews_count(self, obj: MovieTVShow) -> int:
         """
@@ -210,7 +223,7 @@ class MovieTVShowSerializer(serializers.ModelSerializer):
         Returns:
             int: Количество отзывов на фильм/сериал
         """
-        return obj.reviews.count()
+        return obj.reviews_count
     
     def get_ratings_count(self, obj: MovieTVShow) -> int:
         """
@@ -222,7 +235,7 @@ class MovieTVShowSerializer(serializers.ModelSerializer):
         Returns:
             int: Количество оценок фильма/сериала
         """
-        return obj.ratings.count()
+        return obj.ratings_count
     
     def get_is_new_release(self, obj: MovieTVShow) -> bool:
         """
@@ -250,8 +263,8 @@ class MovieTVShowSerializer(serializers.ModelSerializer):
     
     def get_is_highlighted(self, obj: MovieTVShow) -> bool:
         """
-        Пример использования контекста:
-        Проверяет, находится ли фильм в списке выделенных.
+        Находится ли фильм в списке выделенных.
+        Признак вычисляется в запросе аннотацией is_highlighted.
         
         Args:
             obj: Объект фильма/сериала
@@ -259,8 +272,7 @@ class MovieTVShowSerializer(serializers.ModelSerializer):
         Returns:
             bool: True если фильм выделен, False в противном случае
         """
-        highlighted_movies = self.context.get('highlighted_movies', [])
-        return obj.id in highlighted_movies
+        return getattr(obj, 'is_highlighted', False)
 
 
 class MovieTVShowListSerializer(MovieTVShowSerializer):
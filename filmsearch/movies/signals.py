@@ -0,0 +1,138 @@
+from typing import Any, Callable, Type
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Model, QuerySet
+from django.db.models.signals import post_save, post_delete, m2m_changed
+from django.dispatch import receiver
+
+from .api_views import MOVIE_STATISTICS_CACHE_KEY, CATALOG_ETAG_CACHE_KEY
+from .auth_api import ADMIN_DASHBOARD_CACHE_KEY
+from .models import (
+    MovieTVShow, Genre, ActorDirector, Review, Rating,
+    MovieTVShowActorDirector, GenreMovieCount, ActorDirectorMovieCount
+)
+from .tasks import refresh_movie_count_view
+
+
+def invalidate_catalog_caches() -> None:
+    """
+    Сброс кэша статистики, ETag каталога и данных админ-панели.
+    Вызывается обработчиками сигналов и массовыми операциями через
+    QuerySet.update(), которые сигналы не отправляют.
+    """
+    cache.delete_many([MOVIE_STATISTICS_CACHE_KEY, CATALOG_ETAG_CACHE_KEY, ADMIN_DASHBOARD_CACHE_KEY])
+
+
+def _enqueue_refresh(view: Type[Model]) -> Callable[[], None]:
+    """
+    Функция постановки обновления представления в очередь Celery.
+    Args:
+        view: Модель материализованного представления
+    Returns:
+        Callable[[], None]: Функция без аргументов для transaction.on_commit
+    """
+    db_table = view._meta.db_table
+    return lambda: refresh_movie_count_view.delay(db_table)
+
+
+# Один объект функции на представление: по нему on_commit-колбэки
+# текущей транзакции сравниваются при объединении обновлений
+_VIEW_REFRESHES = {
+    view: _enqueue_refresh(view) for view in (GenreMovieCount, ActorDirectorMovieCount)
+}
+
+
+def _refresh_on_commit(view: Type[Model]) -> None:
+    """
+    Отложенное обновление материализованного представления воркером Celery:
+    не более одной задачи на транзакцию, сколько бы строк в ней ни изменилось.
+    Args:
+        view: Модель материализованного представления
+    """
+    refresh = _VIEW_REFRESHES[view]
+    connection = transaction.get_connection()
+    # зарегистрированные колбэки отменяются Django при откате транзакции
+    # или точки сохранения, так что повторная регистрация после отката возможна
+    if connection.in_atomic_block and any(
+        callback is refresh for _, callback, *_ in connection.run_on_commit
+    ):
+        return
+    # недоступность брокера не должна превращать зафиксированное изменение в ошибку
+    transaction.on_commit(refresh, robust=True)
+
+
+@receiver([post_save, post_delete], sender=MovieTVShow)
+@receiver([post_save, post_delete], sender=Genre)
+@receiver([post_save, post_delete], sender=ActorDirector)
+@receiver([post_save, post_delete], sender=Review)
+@receiver([post_save, post_delete], sender=Rating)
+@receiver(m2m_changed, sender=MovieTVShow.genres.through)
+def invalidate_movie_statistics(sender: Type[Model], **kwargs: Any) -> None:
+    """
+    Сброс кэша статистики, ETag каталога и данных админ-панели при изменении
+    фильмов, жанров, актеров, отзывов и рейтингов.
+    Args:
+        sender: Класс измененной модели
+    """
+    invalidate_catalog_caches()
+
+
+@receiver([post_save, post_delete], sender=Review)
+@receiver([post_save, post_delete], sender=Rating)
+def refresh_movie_counters(sender: Type[Model], instance: Model, **kwargs: Any) -> None:
+    """
+    Пересчет денормализованной статистики фильма при изменении оценки или отзыва.
+    Args:
+        sender: Класс измененной модели
+        instance: Измененная оценка или отзыв
+    """
+    # при каскадном удалении фильма пересчитывать нечего, а иначе
+    # выполнялся бы отдельный UPDATE на каждую удаляемую оценку и отзыв
+    origin = kwargs.get('origin')
+    if isinstance(origin, MovieTVShow) or (
+        isinstance(origin, QuerySet) and origin.model is MovieTVShow
+    ):
+        return
+    MovieTVShow.objects.refresh_counters([instance.movie_tvshow_id])
+
+
+@receiver(m2m_changed, sender=MovieTVShow.genres.through)
+@receiver(post_delete, sender=Genre)
+def refresh_genre_movie_counts(sender: Type[Model], **kwargs: Any) -> None:
+    """
+    Обновление количества фильмов по жанрам после фиксации транзакции.
+    Args:
+        sender: Класс измененной модели
+    """
+    action = kwargs.get('action')
+    if action is not None and not action.startswith('post_'):
+        return
+    _refresh_on_commit(GenreMovieCount)
+
+
+@receiver([post_save, post_delete], sender=MovieTVShowActorDirector)
+@receiver(m2m_changed, sender=MovieTVShow.actors_directors.through)
+@receiver(post_delete, sender=ActorDirector)
+def refresh_actor_director_movie_counts(sender: Type[Model], **kwargs: Any) -> None:
+    """
+    Обновление количества фильмов актеров/режиссеров после фиксации транзакции.
+    add()/set()/remove()/clear() связи actors_directors отправляют только m2m_changed.
+    Args:
+        sender: Класс измененной модели
+    """
+    action = kwargs.get('action')
+    if action is not None and not action.startswith('post_'):
+        return
+    _refresh_on_commit(ActorDirectorMovieCount)
+
+
+@receiver(post_delete, sender=MovieTVShow)
+def refresh_movie_counts(sender: Type[Model], **kwargs: Any) -> None:
+    """
+    Обновление количества фильмов по жанрам и актерам при удалении фильма.
+    Args:
+        sender: Класс измененной модели
+    """
+    _refresh_on_commit(GenreMovieCount)
+    _refresh_on_commit(ActorDirectorMovieCount)
@@ -0,0 +1,322 @@
+"""
+Фоновая генерация PDF отчетов для админ-панели.
+
+Верстка PDF через WeasyPrint занимает процессор на секунды, поэтому она
+выполняется воркером Celery, а не в потоке обработки запроса. Запрос только
+ставит задачу в очередь (в брокер передаются идентификаторы фильмов, а не
+HTML) и сразу возвращает ее идентификатор; выборка данных, рендеринг шаблона
+и верстка выполняются в воркере. Задачи хранятся в брокере и переживают
+перезапуск веб-сервера.
+
+Отчеты сохраняются в MEDIA_ROOT/reports/, так что статус задачи
+определяется по файлам и доступен из любого процесса. Файлы старше
+PDF_REPORT_TTL удаляются периодической задачей cleanup_expired_reports.
+"""
+
+import os
+import re
+import time
+import uuid
+from typing import Any, Callable, List, Optional
+
+import weasyprint
+from celery import shared_task
+from weasyprint.text.fonts import FontConfiguration
+from django.conf import settings
+from django.template.loader import render_to_string
+from django.utils import timezone
+
+from .models import MovieTVShow, GenreMovieCount, ActorDirectorMovieCount
+
+
+# Каталог с готовыми отчетами
+REPORTS_DIR = os.path.join(settings.MEDIA_ROOT, 'reports')
+
+# Время хранения отчетов и маркеров задач, в секундах
+REPORT_TTL = getattr(settings, 'PDF_REPORT_TTL', 24 * 60 * 60)
+
+# Статусы задачи генерации отчета
+REPORT_PENDING = 'pending'
+REPORT_READY = 'ready'
+REPORT_FAILED = 'failed'
+
+# Размер блока при отдаче готового отчета, если отдача не делегирована серверу
+REPORT_CHUNK_SIZE = 64 * 1024
+
+_TASK_ID_RE = re.compile(r'^[\w-]+$')
+
+# Материализованные представления с количеством фильмов по имени таблицы
+MOVIE_COUNT_VIEWS = {
+    model._meta.db_table: model for model in (GenreMovieCount, ActorDirectorMovieCount)
+}
+
+
+# Конфигурация шрифтов WeasyPrint создается один раз на процесс воркера:
+# поиск и загрузка шрифтов не повторяются для каждого отчета. Воркер Celery
+# (prefork) выполняет в процессе одну задачу за раз, поэтому конфигурация
+# не используется из нескольких потоков одновременно
+_font_config: Optional[FontConfiguration] = None
+
+
+def get_font_config() -> FontConfiguration:
+    """
+    Конфигурация шрифтов текущего процесса (создается при первом обращении).
+
+    Returns:
+        FontConfiguration: Конфигурация шрифтов WeasyPrint
+    """
+    global _font_config
+    if _font_config is None:
+        _font_config = FontConfiguration()
+    return _font_config
+
+
+def write_pdf(html: str, target: Any) -> None:
+    """
+    Генерация PDF из HTML с общей для процесса конфигурацией шрифтов.
+
+    Args:
+        html: HTML документ
+        target: Объект для записи PDF (файл или путь)
+    """
+    weasyprint.HTML(string=html).write_pdf(target, font_config=get_font_config())
+
+
+def is_valid_task_id(task_id: str) -> bool:
+    """
+    Проверка идентификатора задачи (защита от обхода каталогов).
+
+    Args:
+        task_id: Идентификатор задачи
+
+    Returns:
+        bool: True если идентификатор допустим
+    """
+    return bool(_TASK_ID_RE.match(task_id))
+
+
+def get_report_path(task_id: str) -> str:
+    """
+    Путь к файлу готового отчета.
+
+    Args:
+        task_id: Идентификатор задачи
+
+    Returns:
+        str: Абсолютный путь к PDF файлу
+    """
+    return os.path.join(REPORTS_DIR, f'{task_id}.pdf')
+
+
+def _get_failed_marker_path(task_id: str) -> str:
+    """
+    Путь к файлу-маркеру неудачной генерации.
+
+    Args:
+        task_id: Идентификатор задачи
+
+    Returns:
+        str: Абсолютный путь к маркеру
+    """
+    return os.path.join(REPORTS_DIR, f'{task_id}.failed')
+
+
+def _get_pending_marker_path(task_id: str) -> str:
+    """
+    Путь к файлу-маркеру задачи, поставленной в очередь.
+
+    Args:
+        task_id: Идентификатор задачи
+
+    Returns:
+        str: Абсолютный путь к маркеру
+    """
+    return os.path.join(REPORTS_DIR, f'{task_id}.pending')
+
+
+def _remove_if_exists(path: str) -> None:
+    """
+    Удаление файла, если он существует.
+
+    Args:
+        path: Путь к файлу
+    """
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _save_report(task_id: str, build_html: Callable[[], str]) -> None:
+    """
+    Рендеринг HTML, верстка PDF и атомарное сохранение результата в каталог отчетов.
+
+    Args:
+        task_id: Идентификатор задачи
+        build_html: Функция, возвращающая HTML документ отчета
+    """
+    os.makedirs(REPORTS_DIR, exist_ok=True)
+    report_path = get_report_path(task_id)
+    tmp_path = f'{report_path}.tmp'
+    try:
+        write_pdf(build_html(), tmp_path)
+        os.replace(tmp_path, report_path)
+    except Exception as e:
+        with open(_get_failed_marker_path(task_id), 'w', encoding='utf-8') as marker:
+            marker.write(str(e))
+        _remove_if_exists(tmp_path)
+    finally:
+        _remove_if_exists(_get_pending_marker_path(task_id))
+
+
+def build_movie_report_html(movie_id: int) -> str:
+    """
+    HTML отчета о фильме.
+
+    Args:
+        movie_id: Идентификатор фильма/сериала
+
+    Returns:
+        str: HTML документ отчета
+    """
+    movie = MovieTVShow.objects.get(id=movie_id)
+    context = {
+        'movie': movie,
+        'reviews': movie.reviews.select_related('user').order_by('-created_at')[:10],
+        'ratings': movie.ratings.select_related('user').order_by('-created_at')[:10],
+        'actors': movie.actors_directors.filter(movie_roles__role='actor')[:10],
+        'directors': movie.actors_directors.filter(movie_roles__role='director')[:5],
+        'reviews_count': movie.reviews_count,
+        'ratings_count': movie.ratings_count,
+        'average_rating': movie.avg_rating,
+    }
+    return render_to_string('admin/movies/movie_pdf_report.html', context)
+
+
+def build_movies_summary_html(movie_ids: List[int]) -> str:
+    """
+    HTML сводного отчета по фильмам.
+
+    Args:
+        movie_ids: Идентификаторы фильмов/сериалов
+
+    Returns:
+        str: HTML документ отчета
+    """
+    # шаблон использует movies|length и обходит список несколько раз, поэтому
+    # выборка загружается целиком: один запрос фильмов и один запрос жанров
+    movies = list(MovieTVShow.objects.filter(pk__in=movie_ids).prefetch_related('genres'))
+    # порядок фильмов как в списке админ-панели
+    positions = {movie_id: position for position, movie_id in enumerate(movie_ids)}
+    movies.sort(key=lambda movie: positions[movie.pk])
+    context = {
+        'movies': movies,
+        'total_movies': len(movies),
+        'report_date': timezone.now(),
+    }
+    return render_to_string('admin/movies/movies_summary_pdf.html', context)
+
+
+@shared_task(ignore_result=True)
+def render_movie_report(task_id: str, movie_id: int) -> None:
+    """
+    Генерация PDF отчета о фильме.
+
+    Args:
+        task_id: Идентификатор задачи
+        movie_id: Идентификатор фильма/сериала
+    """
+    _save_report(task_id, lambda: build_movie_report_html(movie_id))
+
+
+@shared_task(ignore_result=True)
+def render_movies_summary_report(task_id: str, movie_ids: List[int]) -> None:
+    """
+    Генерация сводного PDF отчета по фильмам.
+
+    Args:
+        task_id: Идентификатор задачи
+        movie_ids: Идентификаторы фильмов/сериалов
+    """
+    _save_report(task_id, lambda: build_movies_summary_html(movie_ids))
+
+
+@shared_task(ignore_result=True)
+def cleanup_expired_reports() -> int:
+    """
+    Удаление отчетов и маркеров задач старше REPORT_TTL.
+
+    Returns:
+        int: Количество удаленных файлов
+    """
+    if not os.path.isdir(REPORTS_DIR):
+        return 0
+
+    expires_before = time.time() - REPORT_TTL
+    removed = 0
+    with os.scandir(REPORTS_DIR) as entries:
+        for entry in entries:
+            if entry.is_file() and entry.stat().st_mtime < expires_before:
+                _remove_if_exists(entry.path)
+                removed += 1
+    return removed
+
+
+def submit_pdf_report(task: Any, prefix: str, *args: Any) -> str:
+    """
+    Постановка генерации PDF в очередь.
+
+    Args:
+        task: Задача Celery (render_movie_report или render_movies_summary_report)
+        prefix: Префикс идентификатора задачи (например, movie_report_15)
+        *args: Аргументы задачи после идентификатора задачи
+
+    Returns:
+        str: Идентификатор задачи
+
+    Raises:
+        kombu.exceptions.OperationalError: Если брокер недоступен
+    """
+    task_id = f'{prefix}-{uuid.uuid4().hex}'
+    # маркер отличает поставленную задачу от неизвестной или удаленной по TTL;
+    # он создается до постановки, чтобы воркер не завершил задачу раньше
+    os.makedirs(REPORTS_DIR, exist_ok=True)
+    pending_marker = _get_pending_marker_path(task_id)
+    open(pending_marker, 'w').close()
+    try:
+        task.delay(task_id, *args)
+    except Exception:
+        _remove_if_exists(pending_marker)
+        raise
+    return task_id
+
+
+def get_report_status(task_id: str) -> Optional[str]:
+    """
+    Статус задачи генерации отчета.
+
+    Args:
+        task_id: Идентификатор задачи
+
+    Returns:
+        Optional[str]: REPORT_READY, REPORT_FAILED, REPORT_PENDING или None,
+            если задача неизвестна или ее отчет удален по истечении TTL
+    """
+    if os.path.exists(get_report_path(task_id)):
+        return REPORT_READY
+    if os.path.exists(_get_failed_marker_path(task_id)):
+        return REPORT_FAILED
+    if os.path.exists(_get_pending_marker_path(task_id)):
+        return REPORT_PENDING
+    return None
+
+
+@shared_task(ignore_result=True)
+def refresh_movie_count_view(db_table: str) -> None:
+    """
+    Обновление материализованного представления с количеством фильмов.
+
+    Args:
+        db_table: Имя представления (ключ MOVIE_COUNT_VIEWS)
+    """
+    MOVIE_COUNT_VIEWS[db_table].refresh()
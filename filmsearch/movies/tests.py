@@ -1,8 +1,19 @@
 import json
-from django.test import TestCase, Client
+from unittest import mock
+from django.test import TestCase, Client, RequestFactory
 from django.urls import reverse
 from django.contrib.auth.models import User
-from .models import MovieTVShow, Genre, ActorDirector, Review, Rating, Collection, Recommendation
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import QuerySet
+from django.utils import timezone
+from .models import MovieTVShowManager, MovieTVShow, Genre, ActorDirector, GenreMovieCount, ActorDirectorMovieCount, Review, ReviewVote, Rating, Collection, Recommendation
+from .api_views import MOVIE_STATISTICS_CACHE_KEY, CATALOG_ETAG_CACHE_KEY, catalog_etag
+from .auth_api import ADMIN_DASHBOARD_CACHE_KEY
+from .views import MOVIE_DETAIL_REVIEWS_LIMIT, MovieDetailView
+from .filters import RatingFilter
+from .signals import _VIEW_REFRESHES
+from .pagination import make_cursor, parse_cursor, paginate_by_created_at
 from datetime import date, timedelta
 
 class ModelTestCase(TestCase):
@@ -55,12 +66,221 @@ class ModelTestCase(TestCase):
         """Тест: вычисление среднего рейтинга."""
         self.assertEqual(self.movie.get_average_rating(), 9.0)
 
+    def test_movie_detail_reviews_limit(self):
+        """Тест: на странице фильма выводятся только последние MOVIE_DETAIL_REVIEWS_LIMIT отзывов."""
+        Review.objects.bulk_create([
+            Review(movie_tvshow=self.movie, user=self.user, review_text=f'Отзыв {number}')
+            for number in range(MOVIE_DETAIL_REVIEWS_LIMIT + 5)
+        ])
+        request = RequestFactory().get(reverse('movie_detail', args=[self.movie.pk]))
+        request.user = self.user
+        view = MovieDetailView()
+        view.setup(request, pk=self.movie.pk)
+        view.object = view.get_object()
+
+        reviews = view.get_context_data()['reviews']
+        self.assertIsInstance(reviews, QuerySet)
+        expected = list(self.movie.reviews.order_by('-created_at', '-id')[:MOVIE_DETAIL_REVIEWS_LIMIT])
+        self.assertEqual(list(reviews), expected)
+
+    def test_genre_movie_counts_refreshed_once_per_transaction(self):
+        """Тест: несколько изменений жанров в транзакции обновляют представление один раз."""
+        other_genre = Genre.objects.create(name='Другой Жанр')
+        self.movie.genres.add(other_genre)
+        self.movie.genres.remove(other_genre)
+        self.movie.genres.add(other_genre)
+
+        self.assertEqual(self.pending_refreshes(GenreMovieCount), 1)
+
+    def test_actor_director_movie_counts_refreshed_on_m2m_change(self):
+        """Тест: add()/remove() актеров фильма ставят обновление представления один раз."""
+        other_actor = ActorDirector.objects.create(full_name='Другой Актер')
+        self.movie.actors_directors.add(other_actor, through_defaults={'role': 'actor'})
+        self.movie.actors_directors.remove(other_actor)
+
+        self.assertEqual(self.pending_refreshes(ActorDirectorMovieCount), 1)
+
+    def pending_refreshes(self, view):
+        """Количество обновлений представления, ожидающих фиксации транзакции."""
+        return sum(
+            1 for _, callback, *_ in connection.run_on_commit
+            if callback is _VIEW_REFRESHES[view]
+        )
+
     def test_review_str(self):
         """Тест: строковое представление модели Review."""
         expected_str = f"Отзыв от {self.user.username} на {self.movie.title}"
         self.assertEqual(str(self.review), expected_str)
 
 
+
+class MovieCountersTestCase(TestCase):
+    """Тесты денормализованной статистики оценок и отзывов фильма."""
+    @classmethod
+    def setUpTestData(cls):
+        """Создание тестовых данных один раз для всего класса."""
+        cls.first_user = User.objects.create_user(username='first', password='password123')
+        cls.second_user = User.objects.create_user(username='second', password='password123')
+        cls.movie = MovieTVShow.objects.create(
+            title='Фильм для счетчиков',
+            description='Описание фильма для проверки пересчета статистики оценок и отзывов',
+            type='movie',
+            release_date=date(2023, 1, 1),
+            duration=100,
+            country='Россия',
+            age_restriction='12+'
+        )
+
+    def assertCounters(self, avg_rating, ratings_count, reviews_count):
+        """Проверка счетчиков фильма по данным из БД."""
+        self.movie.refresh_from_db()
+        self.assertEqual(self.movie.avg_rating, avg_rating)
+        self.assertEqual(self.movie.ratings_count, ratings_count)
+        self.assertEqual(self.movie.reviews_count, reviews_count)
+
+    def test_counters_without_ratings(self):
+        """Тест: без оценок и отзывов пересчет дает 0.0 и нулевые счетчики."""
+        updated = MovieTVShow.objects.refresh_counters([self.movie.id])
+        self.assertEqual(updated, 1)
+        self.assertCounters(0.0, 0, 0)
+
+    def test_rating_create_update_delete(self):
+        """Тест: создание, изменение и удаление оценки пересчитывают среднюю оценку."""
+        first = Rating.objects.create(movie_tvshow=self.movie, user=self.first_user, rating_value=8)
+        Rating.objects.create(movie_tvshow=self.movie, user=self.second_user, rating_value=6)
+        self.assertCounters(7.0, 2, 0)
+
+        first.rating_value = 10
+        first.save()
+        self.assertCounters(8.0, 2, 0)
+
+        first.delete()
+        self.assertCounters(6.0, 1, 0)
+
+    def test_last_rating_delete_resets_average(self):
+        """Тест: после удаления последней оценки средняя оценка равна 0.0."""
+        rating = Rating.objects.create(movie_tvshow=self.movie, user=self.first_user, rating_value=9)
+        self.assertCounters(9.0, 1, 0)
+
+        rating.delete()
+        self.assertCounters(0.0, 0, 0)
+
+    def test_review_create_update_delete(self):
+        """Тест: создание, изменение и удаление отзыва пересчитывают количество отзывов."""
+        review = Review.objects.create(
+            movie_tvshow=self.movie, user=self.first_user, review_text='Хороший фильм.'
+        )
+        Review.objects.create(movie_tvshow=self.movie, user=self.second_user, review_text='Неплохо.')
+        self.assertCounters(0.0, 0, 2)
+
+        review.review_text = 'Очень хороший фильм.'
+        review.save()
+        self.assertCounters(0.0, 0, 2)
+
+        review.delete()
+        self.assertCounters(0.0, 0, 1)
+
+    def test_movie_delete_skips_counter_refresh(self):
+        """Тест: каскадное удаление фильма не пересчитывает счетчики по каждой записи."""
+        Rating.objects.create(movie_tvshow=self.movie, user=self.first_user, rating_value=7)
+        Review.objects.create(movie_tvshow=self.movie, user=self.first_user, review_text='Отзыв.')
+
+        with mock.patch.object(MovieTVShowManager, 'refresh_counters') as refresh_counters:
+            self.movie.delete()
+        refresh_counters.assert_not_called()
+
+
+class RatingFilterTestCase(TestCase):
+    """Тесты фильтра рейтингов по наличию отзыва."""
+    @classmethod
+    def setUpTestData(cls):
+        """Создание тестовых данных один раз для всего класса."""
+        cls.reviewer = User.objects.create_user(username='reviewer', password='password123')
+        cls.silent_user = User.objects.create_user(username='silent', password='password123')
+        cls.movie, cls.other_movie = [
+            MovieTVShow.objects.create(
+                title=title,
+                description='Описание фильма для проверки фильтра рейтингов по наличию отзыва',
+                type='movie',
+                release_date=date(2022, 5, 1),
+                duration=95,
+                country='Россия',
+                age_restriction='12+'
+            )
+            for title in ('Фильм с отзывом', 'Фильм без отзыва')
+        ]
+        Review.objects.create(movie_tvshow=cls.movie, user=cls.reviewer, review_text='Отзыв к оценке.')
+        cls.reviewed_rating = Rating.objects.create(movie_tvshow=cls.movie, user=cls.reviewer, rating_value=8)
+        # отзыв того же пользователя к другому фильму не относится к этой оценке
+        cls.other_movie_rating = Rating.objects.create(
+            movie_tvshow=cls.other_movie, user=cls.reviewer, rating_value=5
+        )
+        # отзыв другого пользователя к тому же фильму тоже не относится
+        cls.silent_rating = Rating.objects.create(movie_tvshow=cls.movie, user=cls.silent_user, rating_value=3)
+
+    def filter_ratings(self, has_review):
+        """Идентификаторы рейтингов, прошедших фильтр has_review."""
+        filterset = RatingFilter({'has_review': has_review}, queryset=Rating.objects.all())
+        return set(filterset.qs.values_list('id', flat=True))
+
+    def test_has_review_true(self):
+        """Тест: has_review=true оставляет оценки с отзывом того же пользователя к тому же фильму."""
+        self.assertEqual(self.filter_ratings('true'), {self.reviewed_rating.id})
+
+    def test_has_review_false(self):
+        """Тест: has_review=false оставляет оценки без такого отзыва."""
+        self.assertEqual(
+            self.filter_ratings('false'),
+            {self.other_movie_rating.id, self.silent_rating.id}
+        )
+
+
+class TrigramSearchTestCase(TestCase):
+    """Тесты поиска ?search= по триграммам в списке фильмов."""
+    @classmethod
+    def setUpTestData(cls):
+        """Создание тестовых данных один раз для всего класса."""
+        cls.exact, cls.misspelled = [
+            MovieTVShow.objects.create(
+                title=title,
+                description='Space travel',
+                type='movie',
+                release_date=release_date,
+                duration=160,
+                country='USA',
+                age_restriction='12+'
+            )
+            for title, release_date in (
+                ('Interstellar', date(2014, 11, 6)),
+                ('Intersteller', date(2020, 1, 1)),
+            )
+        ]
+
+    def search(self, query, **params):
+        """Идентификаторы фильмов, найденных по запросу."""
+        response = self.client.get(reverse('api_movie_list'), {'search': query, **params})
+        self.assertEqual(response.status_code, 200)
+        return [movie['id'] for movie in response.json()]
+
+    def test_similar_words_ranked_by_similarity(self):
+        """Тест: находятся похожие слова, точное совпадение выше опечатки."""
+        self.assertEqual(self.search('Interstellar'), [self.exact.id, self.misspelled.id])
+
+    def test_explicit_ordering_overrides_similarity(self):
+        """Тест: параметр ordering отменяет сортировку по релевантности."""
+        self.assertEqual(
+            self.search('Interstellar', ordering='-release_date'),
+            [self.misspelled.id, self.exact.id]
+        )
+
+    def test_substring_inside_word_not_matched(self):
+        """Тест: фрагмент внутри слова не находится, в отличие от поиска ILIKE."""
+        self.assertEqual(self.search('ell'), [])
+
+    def test_short_query_uses_substring_search(self):
+        """Тест: запрос короче трех символов ищется как подстрока."""
+        self.assertEqual(set(self.search('st')), {self.exact.id, self.misspelled.id})
+
 class APITestCase(TestCase):
     """Тесты для API эндпоинтов."""
     @classmethod
@@ -143,6 +363,18 @@ class APITestCase(TestCase):
         self.assertTrue(response.json()['success'])
         self.assertTrue(User.objects.filter(username='newuser').exists())
 
+    def test_user_registration_api_user_fields(self):
+        """Тест: ответ регистрации не раскрывает признаки прав доступа пользователя."""
+        response = self.client.post(
+            reverse('api_register'),
+            data=json.dumps(self.register_data),
+            content_type='application/json'
+        )
+        self.assertEqual(
+            set(response.json()['user']),
+            {'id', 'username', 'email', 'first_name', 'last_name'}
+        )
+
     def test_user_login_api(self):
         """Тест: вход пользователя через API."""
         response = self.client.post(
@@ -210,6 +442,69 @@ class APITestCase(TestCase):
         self.review.refresh_from_db()
         self.assertEqual(self.review.moderation_status, 'approved')
 
+    def test_catalog_etag_changes_after_write(self):
+        """Тест: ETag каталога стабилен между запросами и меняется при изменении данных."""
+        etag = catalog_etag(None)
+        self.assertEqual(catalog_etag(None), etag)
+
+        Rating.objects.create(movie_tvshow=self.movie, user=self.regular_user, rating_value=7)
+        self.assertNotEqual(catalog_etag(None), etag)
+
+    def test_review_list_api_vote_counts(self):
+        """Тест: список отзывов отдает лайки, дизлайки и рейтинг отзыва по голосам."""
+        voter = User.objects.create_user(username='voter', password='password123')
+        ReviewVote.objects.create(review=self.review, user=self.admin_user, vote_type='like')
+        ReviewVote.objects.create(review=self.review, user=voter, vote_type='like')
+        ReviewVote.objects.create(review=self.review, user=self.regular_user, vote_type='dislike')
+
+        response = self.client.get(reverse('api_review_list'))
+        self.assertEqual(response.status_code, 200)
+        review_data = next(item for item in response.json() if item['id'] == self.review.id)
+        self.assertEqual(review_data['likes_count'], 2)
+        self.assertEqual(review_data['dislikes_count'], 1)
+        self.assertAlmostEqual(review_data['rating_percentage'], 200 / 3)
+
+    def test_admin_approve_reviews_invalidates_caches(self):
+        """Тест: массовое одобрение отзывов в админ-панели сбрасывает кэши статистики."""
+        cache_keys = [MOVIE_STATISTICS_CACHE_KEY, CATALOG_ETAG_CACHE_KEY, ADMIN_DASHBOARD_CACHE_KEY]
+        cache.set_many({key: 'stale' for key in cache_keys})
+
+        self.client.login(username='admin', password='password123')
+        response = self.client.post(reverse('admin:movies_review_changelist'), {
+            'action': 'approve_reviews',
+            '_selected_action': [self.review.id],
+        })
+        self.assertEqual(response.status_code, 302)
+
+        self.review.refresh_from_db()
+        self.assertEqual(self.review.moderation_status, 'approved')
+        self.assertEqual(cache.get_many(cache_keys), {})
+
+    def test_generate_recommendations_api(self):
+        """Тест: рекомендации создаются только пользователям, не оценившим фильм, и без повторов."""
+        raters = [
+            User.objects.create_user(username=f'rater{number}', password='password123')
+            for number in range(3)
+        ]
+        for rater in raters:
+            Rating.objects.create(movie_tvshow=self.movie, user=rater, rating_value=8)
+
+        self.client.login(username='admin', password='password123')
+        with mock.patch('movies.auth_api.RECOMMENDATION_BATCH_SIZE', 2):
+            response = self.client.post(reverse('api_generate_recommendations'))
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.json()['users_processed'], 5)
+            self.assertEqual(response.json()['recommendations_created'], 2)
+
+            # повторный запуск не создает дубликатов
+            response = self.client.post(reverse('api_generate_recommendations'))
+            self.assertEqual(response.json()['recommendations_created'], 0)
+
+        self.assertEqual(
+            set(Recommendation.objects.filter(movie_tvshow=self.movie).values_list('user_id', flat=True)),
+            {self.admin_user.id, self.regular_user.id}
+        )
+
     def test_pending_reviews_api(self):
         """Тест: получение списка отзывов на модерации."""
         self.client.login(username='admin', password='password123')
@@ -218,6 +513,73 @@ class APITestCase(TestCase):
         self.assertTrue(response.json()['success'])
         self.assertIn('pending_reviews', response.json())
 
+    def collect_api_pages(self, url_name, items_key, limit):
+        """Обход всех страниц API по next_cursor; возвращает идентификаторы записей."""
+        ids, cursor = [], None
+        while True:
+            params = {'limit': limit}
+            if cursor:
+                params['cursor'] = cursor
+            response = self.client.get(reverse(url_name), params)
+            self.assertEqual(response.status_code, 200)
+            data = response.json()
+            self.assertLessEqual(len(data[items_key]), limit)
+            ids.extend(item['id'] for item in data[items_key])
+            cursor = data['next_cursor']
+            if cursor is None:
+                return ids
+
+    def test_collections_api_pages(self):
+        """Тест: подборки с одинаковой датой создания отдаются по курсорам без потерь и повторов."""
+        collections = [
+            Collection.objects.create(title=f'Подборка {number}', user=self.regular_user)
+            for number in range(5)
+        ]
+        Collection.objects.filter(pk__in=[c.pk for c in collections[:3]]).update(
+            created_at=timezone.now() - timedelta(days=1)
+        )
+
+        ids = self.collect_api_pages('api_collections', 'collections', limit=2)
+        expected = list(Collection.objects.order_by('-created_at', '-id').values_list('id', flat=True))
+        self.assertEqual(ids, expected)
+
+    def test_collections_api_malformed_cursor(self):
+        """Тест: некорректный курсор подборок дает ответ 400."""
+        response = self.client.get(reverse('api_collections'), {'cursor': 'garbage'})
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(response.json()['success'])
+
+    def test_pending_reviews_api_pages(self):
+        """Тест: отзывы на модерации с одинаковой датой создания отдаются по курсорам."""
+        reviews = [
+            Review.objects.create(
+                movie_tvshow=self.movie,
+                user=self.admin_user,
+                review_text=f'Отзыв на модерации {number}',
+                moderation_status='pending'
+            )
+            for number in range(4)
+        ]
+        Review.objects.filter(pk__in=[review.pk for review in reviews[:3]]).update(
+            created_at=self.review.created_at
+        )
+
+        self.client.login(username='admin', password='password123')
+        ids = self.collect_api_pages('api_pending_reviews', 'pending_reviews', limit=2)
+        expected = list(
+            Review.objects.filter(moderation_status='pending')
+            .order_by('-created_at', '-id').values_list('id', flat=True)
+        )
+        self.assertEqual(ids, expected)
+        self.assertEqual(len(ids), 5)
+
+    def test_pending_reviews_api_malformed_cursor(self):
+        """Тест: некорректный курсор отзывов на модерации дает ответ 400."""
+        self.client.login(username='admin', password='password123')
+        response = self.client.get(reverse('api_pending_reviews'), {'cursor': 'garbage'})
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(response.json()['success'])
+
     # Тесты профиля пользователя
     def test_profile_api_authenticated(self):
         """Тест: доступ к профилю с аутентификацией."""
@@ -225,3 +587,96 @@ class APITestCase(TestCase):
         response = self.client.get(reverse('api_profile'))
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json()['user']['username'], 'user')
+
+
+class KeysetPaginationTestCase(TestCase):
+    """Тесты keyset-пагинации по (created_at, id) и поиска фильмов с курсором."""
+    @classmethod
+    def setUpTestData(cls):
+        """Создание тестовых данных один раз для всего класса."""
+        cls.movies = [
+            MovieTVShow.objects.create(
+                title=f'Фильм {number}',
+                description='Описание фильма для проверки постраничной выдачи результатов поиска',
+                type='movie',
+                release_date=date(2020, 1, number),
+                duration=90,
+                country='Россия',
+                age_restriction='6+'
+            )
+            for number in range(1, 6)
+        ]
+        # у первых трех фильмов одинаковое время создания
+        cls.tie_created_at = timezone.now() - timedelta(days=1)
+        MovieTVShow.objects.filter(pk__in=[movie.pk for movie in cls.movies[:3]]).update(
+            created_at=cls.tie_created_at
+        )
+
+    def collect_pages(self, page_size):
+        """Обход всех страниц; возвращает идентификаторы записей и количество страниц."""
+        ids, pages, cursor = [], 0, None
+        while True:
+            items, cursor = paginate_by_created_at(MovieTVShow.objects.all(), cursor, page_size)
+            ids.extend(item.pk for item in items)
+            pages += 1
+            if cursor is None:
+                return ids, pages
+
+    def test_cursor_round_trip(self):
+        """Тест: курсор разбирается в исходные дату создания и id."""
+        cursor = make_cursor(self.tie_created_at, 42)
+        self.assertEqual(parse_cursor(cursor), (self.tie_created_at, 42))
+
+    def test_cursor_with_unescaped_plus(self):
+        """Тест: '+' смещения часового пояса, пришедший как пробел, восстанавливается."""
+        cursor = make_cursor(self.tie_created_at, 42).replace('+', ' ')
+        self.assertEqual(parse_cursor(cursor), (self.tie_created_at, 42))
+
+    def test_malformed_cursor(self):
+        """Тест: некорректный курсор не разбирается и отклоняется пагинацией."""
+        for cursor in ('garbage', '2024-01-01T00:00:00', '2024-01-01T00:00:00_abc', 'not-a-date_5'):
+            self.assertIsNone(parse_cursor(cursor))
+            with self.assertRaises(ValueError):
+                paginate_by_created_at(MovieTVShow.objects.all(), cursor, 2)
+
+    def test_pages_with_equal_created_at(self):
+        """Тест: записи с одинаковой датой создания не теряются и не повторяются между страницами."""
+        ids, pages = self.collect_pages(page_size=2)
+        expected = list(MovieTVShow.objects.order_by('-created_at', '-id').values_list('id', flat=True))
+        self.assertEqual(ids, expected)
+        self.assertEqual(pages, 3)
+
+    def test_last_page(self):
+        """Тест: на последней странице курсор следующей страницы равен None."""
+        items, cursor = paginate_by_created_at(MovieTVShow.objects.all(), None, len(self.movies))
+        self.assertEqual(len(items), len(self.movies))
+        self.assertIsNone(cursor)
+
+    def test_values_queryset(self):
+        """Тест: пагинация выборки values() строит курсор из полей словаря."""
+        items, cursor = paginate_by_created_at(MovieTVShow.objects.values('id', 'created_at'), None, 1)
+        self.assertEqual(cursor, make_cursor(items[0]['created_at'], items[0]['id']))
+
+    def test_search_api_pages(self):
+        """Тест: поиск фильмов возвращает все результаты по курсорам next_cursor."""
+        ids, cursor = [], None
+        with mock.patch('movies.api_views.SEARCH_PAGE_SIZE', 2):
+            while True:
+                params = {'cursor': cursor} if cursor else {}
+                response = self.client.get(reverse('api_movie_search'), params)
+                self.assertEqual(response.status_code, 200)
+                data = response.json()
+                self.assertNotIn('count', data)
+                self.assertEqual(data['has_next'], data['next_cursor'] is not None)
+                ids.extend(movie['id'] for movie in data['results'])
+                cursor = data['next_cursor']
+                if cursor is None:
+                    break
+        self.assertEqual(sorted(ids), sorted(movie.pk for movie in self.movies))
+        self.assertEqual(len(ids), len(set(ids)))
+
+    def test_search_api_malformed_cursor(self):
+        """Тест: некорректный курсор в поиске фильмов дает ответ 400."""
+        response = self.client.get(reverse('api_movie_search'), {'cursor': 'garbage'})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('error', response.json())
@@ -120,4 +120,6 @@ urlpatterns: List[URLPattern] = [
     # === PDF ОТЧЕТЫ ДЛЯ АДМИНИСТРАТОРОВ ===
     # Генерация PDF отчета по фильму
     path('admin/movie/<int:movie_id>/pdf/', views.admin_movie_pdf, name='admin_movie_pdf'),
+    # Статус фоновой генерации PDF отчета (готовый отчет отдается как PDF)
+    path('admin/reports/<str:task_id>/', views.admin_pdf_report_status, name='admin_pdf_report_status'),
 ] 
\ No newline at end of file
@@ -9,12 +9,16 @@ from django.utils import timezone
 from django.urls import reverse, reverse_lazy
 from django.contrib import messages
 from django.http import HttpResponseRedirect, HttpResponseForbidden, Http404, HttpRequest, HttpResponse
+from django.db import transaction
 from django.db.models import QuerySet
 from typing import Dict, Any, Optional, Tuple
 from .models import MovieTVShow, ActorDirector, Review, Genre, Collection, UserProfile, Rating, Recommendation
 from django.db.models import Avg, Count, Sum, Max, Min, F, ExpressionWrapper, FloatField, Q
 from .forms import MovieTVShowForm, GenreForm, ReviewForm, CollectionForm, UserProfileForm, CustomUserCreationForm
-from .admin import admin_movie_pdf
+from .admin import admin_movie_pdf, admin_pdf_report_status
+
+# Количество последних отзывов на странице фильма
+MOVIE_DETAIL_REVIEWS_LIMIT = 20
 
 def is_admin(user: User) -> bool:
     """
@@ -54,9 +58,10 @@ def register_view(request: HttpRequest) -> HttpResponse:
     if request.method == 'POST':
         form = CustomUserCreationForm(request.POST)
         if form.is_valid():
-            user = form.save()
-            # Создаем профиль пользователя
-            UserProfile.objects.create(user=user)
+            # Пользователь и профиль создаются в одной транзакции
+            with transaction.atomic():
+                user = form.save()
+                UserProfile.objects.create(user=user)
             username = form.cleaned_data.get('username')
             messages.success(request, f'Аккаунт создан для {username}! Теперь вы можете войти.')
             return redirect('login')
@@ -207,7 +212,7 @@ class MovieTVShowUpdateView(AdminRequiredMixin, UpdateView):
         Returns:
             QuerySet[MovieTVShow]: QuerySet с предзагруженными связанными объектами
         """
-        return MovieTVShow.objects.select_related().prefetch_related('genres')
+        return MovieTVShow.objects.prefetch_related('genres')
     
     def get_context_data(self, **kwargs) -> Dict[str, Any]:
         """
@@ -805,8 +810,6 @@ def generate_recommendations(request: HttpRequest) -> HttpResponseRedirect:
                     genres=genre
                 ).exclude(
                     ratings__user=user
-                ).annotate(
-                    avg_rating=Avg('ratings__rating_value')
                 ).filter(avg_rating__gte=7).order_by('-avg_rating')[:2]
                 
                 for movie in recommended_movies:
@@ -976,11 +979,8 @@ class MovieListView(ListView):
         Returns:
             QuerySet[MovieTVShow]: QuerySet с фильмами и сериалами
         """
-        queryset = MovieTVShow.objects.select_related().prefetch_related(
+        queryset = MovieTVShow.objects.prefetch_related(
             'genres', 'actors_directors'
-        ).annotate(
-            avg_rating=Avg('ratings__rating_value'),
-            reviews_count=Count('reviews')
         )
     
         search_query = self.request.GET.get('search')
@@ -1011,7 +1011,7 @@ class MovieListView(ListView):
         """
         context = super().get_context_data(**kwargs)
         context['now'] = timezone.now()
-        context['new_releases'] = MovieTVShow.objects.select_related().prefetch_related(
+        context['new_releases'] = MovieTVShow.objects.prefetch_related(
             'genres'
         ).filter(
             release_date__gte=timezone.now().date() - timezone.timedelta(days=30)
@@ -1039,16 +1039,13 @@ class MovieDetailView(DetailView):
         Returns:
             QuerySet[MovieTVShow]: QuerySet с предзагруженными связанными объектами
         """
-        return MovieTVShow.objects.select_related().prefetch_related(
-            'genres', 'actors_directors', 'reviews__user', 'ratings'
-        ).annotate(
-            avg_rating=Avg('ratings__rating_value'),
-            reviews_count=Count('reviews')
-        )
+        return MovieTVShow.objects.prefetch_related('genres', 'actors_directors')
     
     def get_context_data(self, **kwargs) -> Dict[str, Any]:
         """
         Добавляет дополнительные данные в контекст.
+        В context['reviews'] попадают только MOVIE_DETAIL_REVIEWS_LIMIT
+        последних отзывов (срез QuerySet, выполняется при выводе в шаблоне).
         
         Args:
             **kwargs: Дополнительные аргументы контекста
@@ -1059,14 +1056,15 @@ class MovieDetailView(DetailView):
         context = super().get_context_data(**kwargs)
         movie = self.object
         
-        reviews = movie.reviews.select_related('user').order_by('-created_at')
-        context['reviews'] = reviews
+        context['reviews'] = movie.reviews.select_related('user').order_by(
+            '-created_at', '-id'
+        )[:MOVIE_DETAIL_REVIEWS_LIMIT]
         
         user_review = None
         user_rating = None
         
         if self.request.user.is_authenticated:
-            user_review = reviews.filter(user=self.request.user).first()
+            user_review = movie.reviews.filter(user=self.request.user).first()
             user_rating = movie.ratings.filter(user=self.request.user).first()
         
         context['user_review'] = user_review
@@ -1173,10 +1171,7 @@ def statistics_view(request: HttpRequest) -> HttpResponse:
     ).order_by('-movies_count')[:10]
     
     # Топ фильмов по рейтингу
-    top_movies = MovieTVShow.objects.annotate(
-        avg_rating=Avg('ratings__rating_value'),
-        ratings_count=Count('ratings')
-    ).filter(ratings_count__gte=3).order_by('-avg_rating')[:10]
+    top_movies = MovieTVShow.objects.filter(ratings_count__gte=3).order_by('-avg_rating')[:10]
     
     # Получаем статистику по жанрам как словари (только нужные поля)
     genres_data = Genre.objects.values(
@@ -1380,10 +1375,7 @@ class GenreDetailView(DetailView):
         genre = self.object
         
         # Получаем фильмы этого жанра с дополнительной информацией
-        movies = genre.movies.select_related().prefetch_related('genres').annotate(
-            avg_rating=Avg('ratings__rating_value'),
-            reviews_count=Count('reviews')
-        ).order_by('-release_date')
+        movies = genre.movies.prefetch_related('genres').order_by('-release_date')
         
         context['movies'] = movies
         context['movies_count'] = movies.count()